@@ -0,0 +1,164 @@
+"""Kavun benchmark runner.
+
+Runs each workload in benchmarks/*.kvn several times, every run in a fresh
+interpreter process, and reports min/median/p95 wall time, the median time
+to the first byte of output, statements per second and peak memory. With
+--taban the results are compared against a baseline saved earlier with
+--kaydet. merhaba.kvn is the startup benchmark: its first output time is
+how long a one-line program takes to answer.
+
+Runs pass --önbelleksiz, so each one parses and compiles its workload from
+scratch. With --önbellekli they measure the other case instead: an untimed
+first run writes the workload's .kvnc cache and the timed runs load it.
+
+    python benchmarks/run.py                       # all workloads, 5 runs each
+    python benchmarks/run.py -n 10 dongu metin     # only these, 10 runs each
+    python benchmarks/run.py --kaydet taban.json   # save as the baseline
+    python benchmarks/run.py --taban taban.json    # compare against it
+    python benchmarks/run.py --önbellekli          # runs that load their .kvnc
+"""
+import argparse 
+import json 
+import math 
+import os 
+import platform 
+import shutil 
+import statistics 
+import subprocess 
+import sys 
+import tempfile 
+import time 
+from pathlib import Path 
+
+HERE =Path (__file__ ).resolve ().parent 
+INTERPRETER =HERE .parent /'interpreter'/'interpreter.py'
+
+
+def run_once (script ,workdir ,extra =()):
+    """Run script once; returns (wall seconds, seconds to the first output or
+    None without output, peak memory in KB or None)."""
+    command =[sys .executable ,str (INTERPRETER ),*extra ,str (script )]
+    with tempfile .TemporaryFile ()as errors :
+        start =time .perf_counter ()
+        process =subprocess .Popen (command ,cwd =workdir ,stdin =subprocess .DEVNULL ,
+        stdout =subprocess .PIPE ,stderr =errors )
+        first =None 
+        if process .stdout .read (1 ):
+            first =time .perf_counter ()-start 
+            while process .stdout .read (65536 ):
+                pass 
+        process .stdout .close ()
+        if hasattr (os ,'wait4'):
+        # wait4 gives this child's own resource usage
+            _ ,status ,usage =os .wait4 (process .pid ,0 )
+            elapsed =time .perf_counter ()-start 
+            process .returncode =os .waitstatus_to_exitcode (status )
+            peak =usage .ru_maxrss 
+            if sys .platform =='darwin':
+                peak //=1024 # bytes there, KB on Linux
+        else :
+            process .wait ()
+            elapsed =time .perf_counter ()-start 
+            peak =None 
+        if process .returncode :
+            errors .seek (0 )
+            message =errors .read ().decode (errors ='replace')
+            raise RuntimeError (f"{script.name} çalışmadı (çıkış kodu {process.returncode}):\n{message}")
+    return elapsed ,first ,peak 
+
+
+def count_statements (script ,workdir ):
+# statements executed, from the line counts of a --profil run
+    report =Path (workdir )/'profil.json'
+    run_once (script ,workdir ,[f'--profil={report}'])
+    rows =json .loads (report .read_text (encoding ='utf-8'))
+    return sum (row ['sayı']for row in rows if row ['tür']=='satır')
+
+
+def percentile (sorted_values ,p ):
+# nearest-rank percentile
+    return sorted_values [max (0 ,math .ceil (p /100 *len (sorted_values ))-1 )]
+
+
+def measure (script ,runs ,cached =False ):
+    with tempfile .TemporaryDirectory (prefix ='kavun-bench-')as workdir :
+        statements =count_statements (script ,workdir )
+        extra =['--önbelleksiz']
+        if cached :
+        # a copy in workdir, so its .kvnc is written there; the first run writes it
+            script =Path (shutil .copy (script ,workdir ))
+            run_once (script ,workdir )
+            extra =[]
+        times ,firsts ,peaks =[],[],[]
+        for _ in range (runs ):
+            elapsed ,first ,peak =run_once (script ,workdir ,extra )
+            times .append (elapsed )
+            firsts .append (first )
+            peaks .append (peak )
+    times .sort ()
+    median =statistics .median (times )
+    return {
+    'min':times [0 ],
+    'medyan':median ,
+    'p95':percentile (times ,95 ),
+    'ilk_çıktı':None if None in firsts else statistics .median (firsts ),
+    'ifade':statements ,
+    'ifade_sn':statements /median ,
+    'bellek_kb':None if None in peaks else max (peaks ),
+    }
+
+
+def change (new ,old ):
+    if not old :
+        return ''
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main ():
+    parser =argparse .ArgumentParser (description ="Kavun iş yüklerini ölçer.")
+    parser .add_argument ('işler',nargs ='*',help ="çalıştırılacak iş yükleri (varsayılan: hepsi)")
+    parser .add_argument ('-n','--tekrar',type =int ,default =5 ,help ="her iş yükü için çalıştırma sayısı")
+    parser .add_argument ('--kaydet',metavar ='DOSYA',help ="sonuçları taban olarak bu JSON dosyasına yaz")
+    parser .add_argument ('--taban',metavar ='DOSYA',help ="sonuçları bu taban JSON dosyasıyla karşılaştır")
+    parser .add_argument ('--önbellekli',action ='store_true',help ="programları .kvnc önbelleğinden yükleyerek ölç")
+    options =parser .parse_args ()
+
+    scripts =sorted (HERE .glob ('*.kvn'))
+    if options .işler :
+        known ={s .stem :s for s in scripts }
+        missing =[name for name in options .işler if name not in known ]
+        if missing :
+            parser .error (f"bilinmeyen iş yükü: {', '.join(missing)} (var olanlar: {', '.join(known)})")
+        scripts =[known [name ]for name in options .işler ]
+    baseline ={}
+    if options .taban :
+        baseline =json .loads (Path (options .taban ).read_text (encoding ='utf-8'))['işler']
+
+    print (f"{'iş':<12} {'min ms':>9} {'medyan ms':>10} {'p95 ms':>9} {'ilk çıktı ms':>13} {'ifade/sn':>11} {'bellek KB':>10}"
+    +(f" {'medyan farkı':>13}"if baseline else ''))
+    results ={}
+    for script in scripts :
+        r =results [script .stem ]=measure (script ,options .tekrar ,options .önbellekli )
+        memory ='-'if r ['bellek_kb']is None else r ['bellek_kb']
+        first ='-'if r ['ilk_çıktı']is None else f"{r['ilk_çıktı'] * 1000:.1f}"
+        line =(f"{script.stem:<12} {r['min'] * 1000:>9.1f} {r['medyan'] * 1000:>10.1f} {r['p95'] * 1000:>9.1f}"
+        f" {first:>13} {r['ifade_sn']:>11.0f} {memory:>10}")
+        if baseline :
+            old =baseline .get (script .stem )
+            line +=f" {change(r['medyan'], old['medyan']) if old else 'yeni':>13}"
+        print (line ,flush =True )
+
+    if options .kaydet :
+        saved ={
+        'python':platform .python_version (),
+        'platform':platform .platform (),
+        'tekrar':options .tekrar ,
+        'önbellekli':options .önbellekli ,
+        'işler':results ,
+        }
+        Path (options .kaydet ).write_text (json .dumps (saved ,ensure_ascii =False ,indent =2 ),encoding ='utf-8')
+        print (f"Taban kaydedildi: {options.kaydet}")
+
+
+if __name__ =='__main__':
+    main ()
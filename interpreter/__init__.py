@@ -0,0 +1,2 @@
+# Kavun as a package: from interpreter import Interpreter
+from .kavun import Interpreter ,run_batch 
@@ -0,0 +1,3886 @@
+#!/usr/bin/env python3
+# Kavun Interpreter - updated (string-protected translations, Turkish booleans, temizle)
+import re ,sys ,ast ,os ,io ,time ,builtins ,keyword ,collections ,operator ,marshal ,types ,_thread 
+
+class LazyModule :
+    """Stands in for a module most programs never touch. The first attribute
+    lookup imports it, runs setup(module) if given, and puts the module in its
+    place (in namespace, by default this module's globals), so startup doesn't
+    pay for it and later lookups go straight to it."""
+    __slots__ =('name','setup','namespace')
+
+    def __init__ (self ,name ,setup =None ,namespace =None ):
+        self .name =name 
+        self .setup =setup 
+        self .namespace =globals ()if namespace is None else namespace 
+
+    def __getattr__ (self ,attr ):
+        module =__import__ (self .name )
+        self .namespace [self .name ]=module 
+        if self .setup is not None :
+            self .setup (module )
+        return getattr (module ,attr )
+
+random ,math ,json ,datetime ,threading ,traceback ,pickle ,mmap ,array ,queue ,warnings =(
+LazyModule (name )for name in ('random','math','json','datetime','threading','traceback','pickle','mmap','array','queue','warnings'))
+
+class LazyPattern :
+    """A regular expression compiled the first time it is used. A run whose
+    program comes from its .kvnc cache never parses, so it never compiles the
+    statement patterns."""
+    __slots__ =('pattern','match')
+
+    def __init__ (self ,pattern ):
+        self .pattern =pattern 
+
+    def __getattr__ (self ,attr ):
+        compiled =re .compile (self .pattern )
+        self .match =compiled .match 
+        return getattr (compiled ,attr )
+
+class ExprCache (dict ):
+    """evaluate()'s compiled expressions by expression text, bounded to about
+    size entries and memory bytes so a process that keeps meeting new
+    expression text (an embedded Interpreter running program after program)
+    doesn't grow without end.
+
+    It approximates least-recently-used eviction with two generations: the
+    dict itself holds the recent entries and older the ones before. Once the
+    recent generation fills half the bounds, the older one is dropped and the
+    recent one takes its place; an older entry used again moves back to the
+    recent one. A hit in the recent generation is a plain dict lookup, which
+    evaluate() does itself; everything else goes through lookup(), which
+    compiles what neither generation holds with compile()."""
+    __slots__ =('older','size','memory','bytes','older_bytes','hits','misses','evictions')
+
+    def __init__ (self ,size ,memory ):
+        super ().__init__ ()
+        self .older ={}
+        self .size =size 
+        self .memory =memory 
+        self .bytes =0 # roughly, of the recent generation
+        self .older_bytes =0 
+        self .hits =0 
+        self .misses =0 
+        self .evictions =0 
+
+    @staticmethod 
+    def entry_size (expr ,entry ):
+    # rough bytes held by one entry: key, code object and its constants
+        code ,call =entry 
+        size =sys .getsizeof (expr )+100 # the entry tuple and its dict slots
+        if code is not None :
+            size +=sys .getsizeof (code )+sum (sys .getsizeof (c )for c in code .co_consts )
+        if call is not None :
+            size +=sum (sys .getsizeof (a )for a in call [1 ])
+        return size 
+
+    def lookup (self ,expr ):
+        """The entry for an expr the recent generation lacks: moved up from the
+        older one, or compiled."""
+        entry =self .older .pop (expr ,None )
+        if entry is None :
+            self .misses +=1 
+            return self .add (expr ,self .compile (expr ))
+        self .hits +=1 
+        self .older_bytes -=self .entry_size (expr ,entry )
+        return self .add (expr ,entry )
+
+    def compile (self ,expr ):
+        return compile_expr (expr )
+
+    def add (self ,expr ,entry ):
+        """Store entry for expr in the recent generation. Returns entry."""
+        if dict .__len__ (self )*2 >=self .size or self .bytes *2 >=self .memory :
+            self .evictions +=len (self .older )
+            self .older =dict (self )
+            self .older_bytes =self .bytes 
+            dict .clear (self )
+            self .bytes =0 
+        self [expr ]=entry 
+        self .bytes +=self .entry_size (expr ,entry )
+        return entry 
+
+    def __len__ (self ):
+        return dict .__len__ (self )+len (self .older )
+
+    def entries (self ):
+        """Every entry, older generation first, as a plain dict."""
+        return {**self .older ,**self }
+
+    def clear (self ):
+        dict .clear (self )
+        self .older .clear ()
+        self .bytes =self .older_bytes =0 
+
+    def stats (self ):
+        """The counters and bounds, with the Turkish keys hafıza_bilgisi() uses."""
+        return {"isabet":self .hits ,"ıska":self .misses ,"atılan":self .evictions ,"boyut":len (self ),
+        "sınır":self .size ,"bayt":self .bytes +self .older_bytes ,"bayt_sınırı":self .memory }
+
+class SlotExprCache (ExprCache ):
+    """compile_slot_expr()'s code by (expression text, slot layout), with the
+    same bounds as the ExprCache it extends."""
+    __slots__ =()
+
+    def compile (self ,key ):
+        expr ,slots =key 
+        return slot_expr_code (expr ,dict (slots ))
+
+        # --- Control flow ---
+        # Statement handlers return one of these (or None to carry on), and run_block
+        # hands it up to the enclosing loop or function call.
+BREAK ,CONTINUE ,RETURN =1 ,2 ,3 # 'kır', 'devam', 'dön'
+
+# Raised when 'kır'/'devam' escape their function or 'dön' is used outside one
+class BreakLoop (Exception ):pass # used by 'kır'
+class ContinueLoop (Exception ):pass # used by 'devam'
+class ReturnFunction (Exception ):# used by 'dön <expr>' or 'dön'
+    def __init__ (self ,value ):
+        self .value =value 
+
+        # --- Runtime state ---
+env =[{}]# stack of variable frames; env[0] is global
+functions ={}# user-defined functions: name -> UserFunction
+EXPR_CACHE_SIZE =4096 # expressions evaluate() keeps compiled
+EXPR_CACHE_MEMORY =16 *1024 *1024 # about this many bytes of them at most
+expr_cache =ExprCache (EXPR_CACHE_SIZE ,EXPR_CACHE_MEMORY )# evaluate() front-end results, keyed by the raw expression text
+slot_codes =SlotExprCache (EXPR_CACHE_SIZE ,EXPR_CACHE_MEMORY )# the same for expressions inside functions
+call_trace =[]# simple call trace for error messages
+MAX_CALL_DEPTH =10000 # user-function calls that may be running at once (--derinlik=N)
+MEMO_SIZE =1024 # results a 'hafızalı' function keeps unless its definition gives a size
+OUTPUT_BUFFER_SIZE =65536 # characters of output collected before they are written (--tampon=N)
+FILE_BUFFER_SIZE =65536 # buffer size for files read by 'satırları:' loops and kept open by dosya_yaz/dosya_ekle
+LINE_INDEX_FILES =16 # files dosya_satırı() keeps mapped
+FILE_HANDLES =32 # files dosya_yaz()/dosya_ekle() keep open between calls
+LINE_SCAN_CHUNK =1 <<20 # bytes of a mapped file searched for line ends at a time
+
+# --- Built-in functions ---
+def builtin_rastgele (min_val =1 ,max_val =100 ):
+    """Rastgele sayı üret"""
+    return random .randint (min_val ,max_val )
+
+def builtin_ondalık_rastgele ():
+    """0 ile 1 arasında ondalık rastgele sayı"""
+    return random .random ()
+
+def builtin_karekök (sayi ):
+    """Sayının karekökünü al"""
+    return math .sqrt (sayi )
+
+def builtin_kuvvet (taban ,us ):
+    """Tabanın üssünü al"""
+    return math .pow (taban ,us )
+
+def builtin_mutlak (sayi ):
+    """Sayının mutlak değerini al"""
+    return abs (sayi )
+
+def builtin_yuvarla (sayi ,basamak =0 ):
+    """Sayıyı yuvarla"""
+    return round (sayi ,basamak )
+
+def builtin_sin (sayi ):
+    """Sinüs değerini hesapla"""
+    return math .sin (sayi )
+
+def builtin_cos (sayi ):
+    """Kosinüs değerini hesapla"""
+    return math .cos (sayi )
+
+def builtin_tan (sayi ):
+    """Tanjant değerini hesapla"""
+    return math .tan (sayi )
+
+def builtin_log (sayi ):
+    """Doğal logaritma"""
+    return math .log (sayi )
+
+def builtin_log10 (sayi ):
+    """10 tabanında logaritma"""
+    return math .log10 (sayi )
+
+def builtin_bekle (saniye ):
+    """Belirtilen saniye kadar bekle"""
+    flush_output ()
+    time .sleep (saniye )
+
+def builtin_şimdi ():
+    """Şu anki zamanı döndür"""
+    return datetime .datetime .now ().strftime ("%Y-%m-%d %H:%M:%S")
+
+def builtin_tarih ():
+    """Bugünün tarihini döndür"""
+    return datetime .datetime .now ().strftime ("%d/%m/%Y")
+
+def builtin_saat ():
+    """Şu anki saati döndür"""
+    return datetime .datetime .now ().strftime ("%H:%M:%S")
+
+def builtin_liste_oluştur (*elemanlar ):
+    """Yeni liste oluştur"""
+    return list (elemanlar )
+
+def builtin_liste_ekle (liste ,eleman ):
+    """Listeye eleman ekle"""
+    if not isinstance (liste ,list ):
+        raise RuntimeError ("İlk parametre liste olmalı")
+    liste .append (eleman )
+    return liste 
+
+def builtin_liste_uzunluk (liste ):
+    """Listenin uzunluğunu döndür"""
+    if not isinstance (liste ,list ):
+        raise RuntimeError ("Parametre liste olmalı")
+    return len (liste )
+
+def builtin_liste_eleman (liste ,index ):
+    """Listenin belirtilen indeksindeki elemanı döndür"""
+    if not isinstance (liste ,list ):
+        raise RuntimeError ("İlk parametre liste olmalı")
+    if index <0 or index >=len (liste ):
+        raise RuntimeError ("Geçersiz indeks")
+    return liste [index ]
+
+def builtin_liste_sil (liste ,index ):
+    """Listeden belirtilen indeksteki elemanı sil"""
+    if not isinstance (liste ,list ):
+        raise RuntimeError ("İlk parametre liste olmalı")
+    if index <0 or index >=len (liste ):
+        raise RuntimeError ("Geçersiz indeks")
+    return liste .pop (index )
+
+def builtin_metin_uzunluk (metin ):
+    """Metnin uzunluğunu döndür"""
+    return len (str (metin ))
+
+def builtin_metin_oluşturucu (*parçalar ):
+    """Parça parça büyüyen yeni bir metin oluştur"""
+    builder =TextBuilder ()
+    for parça in parçalar :
+        builder .append (parça )
+    return builder 
+
+def builtin_metin_kes (metin ,baslangic ,bitis =None ):
+    """Metni kes"""
+    metin =str (metin )
+    if bitis is None :
+        return metin [baslangic :]
+    return metin [baslangic :bitis ]
+
+def builtin_metin_bul (metin ,aranan ):
+    """Metinde arama yap, bulunursa indeks döndür"""
+    metin =str (metin )
+    aranan =str (aranan )
+    try :
+        return metin .index (aranan )
+    except ValueError :
+        return -1 
+
+def builtin_metin_değiştir (metin ,eski ,yeni ):
+    """Metindeki eski kısmı yeni ile değiştir"""
+    return str (metin ).replace (str (eski ),str (yeni ))
+
+def builtin_büyük_harf (metin ):
+    """Metni büyük harfe çevir"""
+    return str (metin ).upper ()
+
+def builtin_küçük_harf (metin ):
+    """Metni küçük harfe çevir"""
+    return str (metin ).lower ()
+
+class FileHandles :
+    """The files dosya_yaz and dosya_ekle write, kept open by absolute path so
+    a loop writing a file again and again doesn't open and close it on every
+    call. What is written collects in each file's FILE_BUFFER_SIZE buffer.
+    Everything else that looks at a file calls sync() or close() on it first,
+    so programs see the same contents as with unbuffered writes. The least
+    recently used file is closed once more than size are open, and
+    run_program() closes them all when the program ends."""
+    __slots__ =('files','size')
+
+    def __init__ (self ,size ):
+        self .files =collections .OrderedDict ()# absolute path -> text file opened for appending
+        self .size =size 
+
+    def write (self ,path ,text ,truncate =False ):
+        """Append text to the file at path, first emptying it with truncate."""
+        key =os .path .abspath (path )
+        f =self .files .get (key )
+        if f is None :
+            f =open (path ,'a',encoding ='utf-8',buffering =FILE_BUFFER_SIZE )
+            self .files [key ]=f 
+            if len (self .files )>self .size :
+                self .files .popitem (last =False )[1 ].close ()
+        else :
+            self .files .move_to_end (key )
+        if truncate :
+            f .seek (0 )
+            f .truncate ()
+        f .write (text )
+
+    def sync (self ,path ):
+    # write out what is pending for path before it is read
+        if self .files :
+            f =self .files .get (os .path .abspath (path ))
+            if f is not None :
+                f .flush ()
+
+    def close (self ,path ):
+    # before path is removed
+        if self .files :
+            f =self .files .pop (os .path .abspath (path ),None )
+            if f is not None :
+                f .close ()
+
+    def drain (self ):
+        """Write out what every file has pending, raising the first failure.
+        That file is dropped, so close_all() doesn't report it again."""
+        for path ,f in self .files .items ():
+            try :
+                f .flush ()
+            except Exception as e :
+                del self .files [path ]
+                try :
+                    f .close ()
+                except Exception :
+                    pass 
+                raise RuntimeError (f"Dosya yazma hatası: {path}: {e}")
+
+    def close_all (self ):
+        """Close every file. Returns the messages for the ones whose pending
+        text couldn't be written."""
+        failures =[]
+        while self .files :
+            path ,f =self .files .popitem (last =False )
+            try :
+                f .close ()
+            except Exception as e :
+                failures .append (f"Dosya yazma hatası: {path}: {e}")
+        return failures 
+
+file_handles =FileHandles (FILE_HANDLES )
+
+class WriteFailed (RuntimeError ):
+    """A write the WriteBehind thread couldn't do, raised by the program's next
+    operation on the same file (or drain()) with the message the built-in
+    would have given."""
+
+class WriteBehind :
+    """Stands in for file_handles with --arkaplanda-yaz: dosya_yaz and
+    dosya_ekle put their writes on a queue and return, and one writer thread
+    applies them in order to the FileHandles pool, so the program keeps
+    computing while its files are written. sync() and close() of a path written
+    this way wait until the writer has done everything queued before them;
+    close_all() waits for the whole queue."""
+    __slots__ =('files','queue','thread','written','errors')
+
+    def __init__ (self ,files ):
+        self .files =files # only the writer thread touches it
+        self .queue =queue .SimpleQueue ()
+        self .thread =None 
+        self .written =set ()# absolute paths with writes queued since they were last closed
+        self .errors ={}# absolute path (None for drain) -> its first WriteFailed not raised yet
+
+    def run (self ):
+    # the writer thread: (function, args, key, label, done) items; done is an Event to set, or None
+        while True :
+            function ,args ,key ,label ,done =self .queue .get ()
+            try :
+                function (*args )
+            except Exception as e :
+                if key not in self .errors :
+                    self .errors [key ]=WriteFailed (f"{label}: {e}"if label else str (e ))
+            if done is not None :
+                done .set ()
+
+    def put (self ,function ,args ,key ,label ,wait =False ):
+        if self .thread is None :
+            self .thread =threading .Thread (target =self .run ,name ='kavun-yazıcı',daemon =True )
+            self .thread .start ()
+        done =threading .Event ()if wait else None 
+        self .queue .put ((function ,args ,key ,label ,done ))
+        if done is not None :
+            done .wait ()
+
+    def check (self ,key ):
+    # raise the failed write of the file at key
+        error =self .errors .pop (key ,None )
+        if error is not None :
+            raise error 
+
+    def write (self ,path ,text ,truncate =False ):
+        key =os .path .abspath (path )
+        self .check (key )
+        self .written .add (key )
+        self .put (self .files .write ,(path ,text ,truncate ),key ,"Dosya yazma hatası"if truncate else "Dosya ekleme hatası")
+
+    def sync (self ,path ):
+        key =os .path .abspath (path )
+        if key in self .written :
+            self .put (self .files .sync ,(path ,),key ,"Dosya yazma hatası",wait =True )
+        self .check (key )
+
+    def close (self ,path ):
+        key =os .path .abspath (path )
+        if key in self .written :
+            self .written .discard (key )
+            self .put (self .files .close ,(path ,),key ,"Dosya yazma hatası",wait =True )
+        self .check (key )
+
+    def drain (self ):
+        """Wait for the queued writes and write out what the files have pending,
+        raising the oldest failure of any file not raised yet."""
+        if self .thread is not None :
+            self .put (self .files .drain ,(),None ,None ,wait =True )
+        if self .errors :
+            raise self .errors .pop (next (iter (self .errors )))
+
+    def close_files (self ,failures ):
+    # the writer thread's part of close_all()
+        failures .extend (self .files .close_all ())
+
+    def close_all (self ):
+        """Wait for the queued writes and close the files. Returns the messages
+        for the failures not raised yet, like FileHandles.close_all()."""
+        failures =[]
+        if self .thread is not None :
+            self .put (self .close_files ,(failures ,),None ,None ,wait =True )
+        self .written .clear ()
+        failures [:0 ]=[str (e )for e in self .errors .values ()]
+        self .errors .clear ()
+        return failures 
+
+def builtin_dosya_oku (dosya_adi ):
+    """Dosyayı oku"""
+    file_handles .sync (dosya_adi )
+    try :
+        with open (dosya_adi ,'r',encoding ='utf-8')as f :
+            return f .read ()
+    except FileNotFoundError :
+        raise RuntimeError (f"Dosya bulunamadı: {dosya_adi}")
+    except Exception as e :
+        raise RuntimeError (f"Dosya okuma hatası: {e}")
+
+def builtin_dosya_yaz (dosya_adi ,içerik ):
+    """Dosyaya yaz"""
+    drop_line_index (dosya_adi )
+    try :
+        file_handles .write (dosya_adi ,str (içerik ),truncate =True )
+        return True 
+    except WriteFailed :
+        raise 
+    except Exception as e :
+        raise RuntimeError (f"Dosya yazma hatası: {e}")
+
+def builtin_dosya_ekle (dosya_adi ,içerik ):
+    """Dosyaya ekle"""
+    drop_line_index (dosya_adi )
+    try :
+        file_handles .write (dosya_adi ,str (içerik ))
+        return True 
+    except WriteFailed :
+        raise 
+    except Exception as e :
+        raise RuntimeError (f"Dosya ekleme hatası: {e}")
+
+def file_lines (dosya_adi ):
+    """The lines of a text file without their line ends, for a 'satırları:'
+    loop. They are read lazily through a FILE_BUFFER_SIZE buffer, so the loop
+    holds one line at a time however large the file is. The file is opened
+    right away, so a missing file is reported before the loop starts."""
+    file_handles .sync (dosya_adi )
+    try :
+        f =open (dosya_adi ,'r',encoding ='utf-8',buffering =FILE_BUFFER_SIZE )
+    except FileNotFoundError :
+        raise RuntimeError (f"Dosya bulunamadı: {dosya_adi}")
+    except Exception as e :
+        raise RuntimeError (f"Dosya okuma hatası: {e}")
+    return read_lines (f )
+
+def read_lines (f ):
+# closes f when the lines run out, or when a loop left early drops the generator
+    with f :
+        try :
+            for line in f :
+                yield line [:-1 ]if line .endswith ('\n')else line 
+        except UnicodeDecodeError as e :
+            raise RuntimeError (f"Dosya okuma hatası: {e}")
+
+class LineIndex :
+    """Random access to the lines of a file through an mmap of it. Line start
+    offsets are found as far as the highest line asked for, so reading line
+    10 of a huge file doesn't scan the rest of it."""
+    __slots__ =('data','offsets','scanned','stamp')
+
+    def __init__ (self ,path ,stamp ):
+        self .stamp =stamp # (mtime, size) the index was built for
+        with open (path ,'rb')as f :
+            self .data =mmap .mmap (f .fileno (),0 ,access =mmap .ACCESS_READ )if stamp [1 ]else b''
+        self .offsets =array .array ('q',[0 ])# offsets[k]: where line k+1 starts
+        self .scanned =0 # bytes searched for line ends so far
+
+    def reach (self ,k ):
+    # find line starts up to offsets[k], a chunk at a time; False if the file has fewer than k+1 lines
+        data ,offsets =self .data ,self .offsets 
+        end =len (data )
+        while len (offsets )<=k and self .scanned <end :
+            pos =self .scanned 
+            chunk =data [pos :pos +LINE_SCAN_CHUNK ]
+            offsets .extend (pos +m .end ()for m in NEWLINE_RE .finditer (chunk ))
+            self .scanned =pos +len (chunk )
+        return k <len (offsets )and offsets [k ]<end 
+
+    def line (self ,n ):
+        if n <1 or not self .reach (n -1 ):
+            return None 
+        start =self .offsets [n -1 ]
+        end =self .data .find (b'\n',start )
+        text =self .data [start :end if end >=0 else len (self .data )].decode ('utf-8',errors ='replace')
+        return text [:-1 ]if text .endswith ('\r')else text 
+
+    def count (self ):
+        self .reach (sys .maxsize )
+        # the last offset is the end of the file when it ends in a line end (or is empty)
+        return len (self .offsets )-(self .offsets [-1 ]==len (self .data ))
+
+    def close (self ):
+        if self .data :
+            self .data .close ()
+
+line_indexes ={}# path -> LineIndex, at most LINE_INDEX_FILES of them
+NEWLINE_RE =LazyPattern (rb'\n')
+
+def line_index (dosya_adi ):
+# the file's LineIndex, rebuilt when the file changed since it was made
+    file_handles .sync (dosya_adi )
+    try :
+        st =os .stat (dosya_adi )
+    except FileNotFoundError :
+        raise RuntimeError (f"Dosya bulunamadı: {dosya_adi}")
+    except Exception as e :
+        raise RuntimeError (f"Dosya okuma hatası: {e}")
+    stamp =(st .st_mtime_ns ,st .st_size )
+    index =line_indexes .pop (dosya_adi ,None )
+    if index is not None and index .stamp !=stamp :
+        index .close ()
+        index =None 
+    if index is None :
+        try :
+            index =LineIndex (dosya_adi ,stamp )
+        except Exception as e :
+            raise RuntimeError (f"Dosya okuma hatası: {e}")
+        if len (line_indexes )>=LINE_INDEX_FILES :
+            line_indexes .pop (next (iter (line_indexes ))).close ()
+    line_indexes [dosya_adi ]=index # most recently used last
+    return index 
+
+def drop_line_index (dosya_adi ):
+# unmap a file about to be changed or removed (Windows refuses while it is mapped)
+    index =line_indexes .pop (dosya_adi ,None )
+    if index is not None :
+        index .close ()
+
+def builtin_dosya_satırı (dosya_adi ,satır_no ):
+    """Dosyanın satır_no'ncu satırını (1'den başlar) döndür, yoksa hata ver"""
+    text =line_index (dosya_adi ).line (int (satır_no ))
+    if text is None :
+        raise RuntimeError (f"Dosyada {satır_no}. satır yok: {dosya_adi}")
+    return text 
+
+def builtin_dosya_satır_sayısı (dosya_adi ):
+    """Dosyadaki satır sayısını döndür"""
+    return line_index (dosya_adi ).count ()
+
+def builtin_dosya_var_mı (dosya_adi ):
+    """Dosyanın var olup olmadığını kontrol et"""
+    file_handles .sync (dosya_adi )
+    return os .path .exists (dosya_adi )
+
+def builtin_dosya_sil (dosya_adi ):
+    """Dosyayı sil"""
+    drop_line_index (dosya_adi )
+    file_handles .close (dosya_adi )
+    try :
+        os .remove (dosya_adi )
+        return True 
+    except FileNotFoundError :
+        return False 
+    except Exception as e :
+        raise RuntimeError (f"Dosya silme hatası: {e}")
+
+def builtin_klasör_oluştur (klasör_adi ):
+    """Klasör oluştur"""
+    try :
+        os .makedirs (klasör_adi ,exist_ok =True )
+        return True 
+    except Exception as e :
+        raise RuntimeError (f"Klasör oluşturma hatası: {e}")
+
+def builtin_klasör_listesi (klasör_adi ="."):
+    """Klasördeki dosyaları listele"""
+    file_handles .drain ()# files still queued by --arkaplanda-yaz may not exist yet
+    try :
+        return os .listdir (klasör_adi )
+    except Exception as e :
+        raise RuntimeError (f"Klasör listesi alma hatası: {e}")
+
+        # colorama (cross-platform colored output) is set up the first time a
+        # program prints in colour. Its init() wraps sys.stdout; main()'s Output
+        # stays in front and writes to the wrapped stream.
+def init_colorama (module ):
+    if module .initialise .orig_stdout is not None :
+        return # already set up in this process, by another Interpreter
+    wrap_colorama (module )
+
+def wrap_colorama (module ):
+# colorama.init() on the real stdout, under an Output if there is one
+    output =sys .stdout if isinstance (sys .stdout ,Output )else None 
+    if output is not None :
+        output .flush ()
+        sys .stdout =output .stream 
+    module .init ()
+    if output is not None :
+        output .stream =sys .stdout 
+        sys .stdout =output 
+
+colorama =LazyModule ('colorama',init_colorama )
+
+class Output :
+    """Buffered writer a program's output goes through (main() installs it as
+    sys.stdout). Text is collected and handed to the real stream in one write
+    once size characters are pending; on a terminal every finished line is
+    written at once. flush_output() empties it before the program waits for
+    the user or the clock, clears the screen, and at exit. The animation
+    thread writes too, so both go through lock."""
+
+    def __init__ (self ,stream ,size =OUTPUT_BUFFER_SIZE ):
+        self .stream =stream 
+        self .size =size 
+        self .line_buffered =stream .isatty ()
+        self .parts =[]
+        self .pending =0 
+        self .lock =_thread .allocate_lock ()# threading.Lock, without importing threading at startup
+
+    def write (self ,text ):
+    # acquire()/release() rather than 'with': this runs for every print
+        self .lock .acquire ()
+        try :
+            self .parts .append (text )
+            self .pending +=len (text )
+            full =self .pending >=self .size or (self .line_buffered and text .endswith ('\n'))
+        finally :
+            self .lock .release ()
+        if full :
+            self .flush ()
+        return len (text )
+
+    def flush (self ):
+    # held while writing, so text flushed by two threads keeps its order
+        with self .lock :
+            parts ,self .parts =self .parts ,[]
+            self .pending =0 
+            if parts :
+                self .stream .write (''.join (parts ))
+            self .stream .flush ()
+
+    def __getattr__ (self ,name ):
+    # encoding, isatty(), fileno(), ... of the real stream
+        return getattr (self .stream ,name )
+
+def flush_output ():
+    sys .stdout .flush ()
+
+    # Animation state
+animation_running =False 
+animation_thread =None 
+
+# --- New Built-in Functions ---
+
+def builtin_kırmızı_yaz (metin ):
+    """Metni kırmızı renkte yazdır"""
+    print (colorama .Fore .RED +str (metin )+colorama .Style .RESET_ALL )
+
+def builtin_yeşil_yaz (metin ):
+    """Metni yeşil renkte yazdır"""
+    print (colorama .Fore .GREEN +str (metin )+colorama .Style .RESET_ALL )
+
+def builtin_sarı_yaz (metin ):
+    """Metni sarı renkte yazdır"""
+    print (colorama .Fore .YELLOW +str (metin )+colorama .Style .RESET_ALL )
+
+def builtin_mavi_yaz (metin ):
+    """Metni mavi renkte yazdır"""
+    print (colorama .Fore .BLUE +str (metin )+colorama .Style .RESET_ALL )
+
+def builtin_mor_yaz (metin ):
+    """Metni mor renkte yazdır"""
+    print (colorama .Fore .MAGENTA +str (metin )+colorama .Style .RESET_ALL )
+
+def builtin_cyan_yaz (metin ):
+    """Metni cyan renkte yazdır"""
+    print (colorama .Fore .CYAN +str (metin )+colorama .Style .RESET_ALL )
+
+def builtin_animasyonlu_yaz (metin ):
+    """Metni animasyonlu olarak yazdır"""
+    global animation_running ,animation_thread 
+    animation_running =True 
+
+    def animate ():
+        global animation_running 
+        chars ="⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+        i =0 
+        while animation_running :
+            print (f"\r{chars[i % len(chars)]} {metin}",end ="",flush =True )
+            time .sleep (0.1 )
+            i +=1 
+        print ()# New line when done
+
+    animation_thread =threading .Thread (target =animate )
+    animation_thread .start ()
+
+def builtin_animasyon_durdur ():
+    """Animasyonu durdur"""
+    global animation_running 
+    animation_running =False 
+    if animation_thread :
+        animation_thread .join ()
+
+def print_lines (lines ):
+# a drawing in one write
+    if lines :
+        print ("\n".join (lines ))
+
+def builtin_üçgen_çiz (boyut ):
+    """ASCII üçgen çiz"""
+    print_lines ([" "*(boyut -i -1 )+"*"*(2 *i +1 )for i in range (boyut )])
+
+def builtin_kare_çiz (boyut ):
+    """ASCII kare çiz"""
+    lines =[]
+    for i in range (boyut ):
+        if i ==0 or i ==boyut -1 :
+            lines .append ("*"*boyut )
+        else :
+            lines .append ("*"+" "*(boyut -2 )+"*")
+    print_lines (lines )
+
+def builtin_kalp_çiz ():
+    """ASCII kalp çiz"""
+    heart =[
+    "  ***   ***  ",
+    " ***** ***** ",
+    "************* ",
+    " *********** ",
+    "  *********  ",
+    "   *******   ",
+    "    *****    ",
+    "     ***     ",
+    "      *      "
+    ]
+    print_lines ([colorama .Fore .RED +line +colorama .Style .RESET_ALL for line in heart ])
+
+def builtin_grafik_çiz (veriler ):
+    """Basit çubuk grafik çiz"""
+    if not veriler :
+        return 
+
+    max_val =max (veriler )
+    lines =[]
+    for i ,val in enumerate (veriler ):
+        bar_length =int ((val /max_val )*20 )
+        bar ="█"*bar_length 
+        lines .append (f"{i+1:2d}: {bar} {val}")
+    print_lines (lines )
+
+def builtin_sözlük_oluştur (*elemanlar ):
+    """Yeni sözlük oluştur"""
+    if len (elemanlar )%2 !=0 :
+        raise RuntimeError ("Sözlük için anahtar-değer çiftleri gerekli")
+
+    sözlük ={}
+    for i in range (0 ,len (elemanlar ),2 ):
+        sözlük [elemanlar [i ]]=elemanlar [i +1 ]
+    return sözlük 
+
+def builtin_sözlük_eleman (sözlük ,anahtar ):
+    """Sözlükten eleman al"""
+    if not isinstance (sözlük ,dict ):
+        raise RuntimeError ("İlk parametre sözlük olmalı")
+    return sözlük .get (anahtar )
+
+def builtin_sözlük_ekle (sözlük ,anahtar ,değer ):
+    """Sözlüğe eleman ekle"""
+    if not isinstance (sözlük ,dict ):
+        raise RuntimeError ("İlk parametre sözlük olmalı")
+    sözlük [anahtar ]=değer 
+    return sözlük 
+
+def builtin_sözlük_sil (sözlük ,anahtar ):
+    """Sözlükten eleman sil"""
+    if not isinstance (sözlük ,dict ):
+        raise RuntimeError ("İlk parametre sözlük olmalı")
+    if anahtar in sözlük :
+        return sözlük .pop (anahtar )
+    return None 
+
+def builtin_sözlük_anahtarlar (sözlük ):
+    """Sözlüğün anahtarlarını döndür"""
+    if not isinstance (sözlük ,dict ):
+        raise RuntimeError ("Parametre sözlük olmalı")
+    return list (sözlük .keys ())
+
+def builtin_sözlük_değerler (sözlük ):
+    """Sözlüğün değerlerini döndür"""
+    if not isinstance (sözlük ,dict ):
+        raise RuntimeError ("Parametre sözlük olmalı")
+    return list (sözlük .values ())
+
+def builtin_sözlük_uzunluk (sözlük ):
+    """Sözlüğün uzunluğunu döndür"""
+    if not isinstance (sözlük ,dict ):
+        raise RuntimeError ("Parametre sözlük olmalı")
+    return len (sözlük )
+
+def builtin_hafıza_bilgisi (fonksiyon_adi ):
+    """'hafızalı' bir fonksiyonun önbellek sayaçlarını döndür"""
+    function =functions .get (fonksiyon_adi )
+    if function is None or function .memo is None :
+        raise RuntimeError (f"'{fonksiyon_adi}' hafızalı bir fonksiyon değil")
+    memo =function .memo 
+    return {"isabet":memo .hits ,"ıska":memo .misses ,"boyut":len (memo .results ),"sınır":memo .size }
+
+    # Built-in functions dictionary
+builtin_functions ={
+'rastgele':builtin_rastgele ,
+'ondalık_rastgele':builtin_ondalık_rastgele ,
+'karekök':builtin_karekök ,
+'kuvvet':builtin_kuvvet ,
+'mutlak':builtin_mutlak ,
+'yuvarla':builtin_yuvarla ,
+'sin':builtin_sin ,
+'cos':builtin_cos ,
+'tan':builtin_tan ,
+'log':builtin_log ,
+'log10':builtin_log10 ,
+'bekle':builtin_bekle ,
+'şimdi':builtin_şimdi ,
+'tarih':builtin_tarih ,
+'saat':builtin_saat ,
+'liste_oluştur':builtin_liste_oluştur ,
+'liste_ekle':builtin_liste_ekle ,
+'liste_uzunluk':builtin_liste_uzunluk ,
+'liste_eleman':builtin_liste_eleman ,
+'liste_sil':builtin_liste_sil ,
+'metin_uzunluk':builtin_metin_uzunluk ,
+'metin_oluşturucu':builtin_metin_oluşturucu ,
+'metin_kes':builtin_metin_kes ,
+'metin_bul':builtin_metin_bul ,
+'metin_değiştir':builtin_metin_değiştir ,
+'büyük_harf':builtin_büyük_harf ,
+'küçük_harf':builtin_küçük_harf ,
+'dosya_oku':builtin_dosya_oku ,
+'dosya_yaz':builtin_dosya_yaz ,
+'dosya_ekle':builtin_dosya_ekle ,
+'dosya_var_mı':builtin_dosya_var_mı ,
+'dosya_sil':builtin_dosya_sil ,
+'dosya_satırı':builtin_dosya_satırı ,
+'dosya_satır_sayısı':builtin_dosya_satır_sayısı ,
+'klasör_oluştur':builtin_klasör_oluştur ,
+'klasör_listesi':builtin_klasör_listesi ,
+# Yeni renkli yazdırma fonksiyonları
+'kırmızı_yaz':builtin_kırmızı_yaz ,
+'yeşil_yaz':builtin_yeşil_yaz ,
+'sarı_yaz':builtin_sarı_yaz ,
+'mavi_yaz':builtin_mavi_yaz ,
+'mor_yaz':builtin_mor_yaz ,
+'cyan_yaz':builtin_cyan_yaz ,
+'animasyonlu_yaz':builtin_animasyonlu_yaz ,
+'animasyon_durdur':builtin_animasyon_durdur ,
+# Çizim fonksiyonları
+'üçgen_çiz':builtin_üçgen_çiz ,
+'kare_çiz':builtin_kare_çiz ,
+'kalp_çiz':builtin_kalp_çiz ,
+'grafik_çiz':builtin_grafik_çiz ,
+# Sözlük işlemleri
+'sözlük_oluştur':builtin_sözlük_oluştur ,
+'sözlük_eleman':builtin_sözlük_eleman ,
+'sözlük_ekle':builtin_sözlük_ekle ,
+'sözlük_sil':builtin_sözlük_sil ,
+'sözlük_anahtarlar':builtin_sözlük_anahtarlar ,
+'sözlük_değerler':builtin_sözlük_değerler ,
+'sözlük_uzunluk':builtin_sözlük_uzunluk ,
+'hafıza_bilgisi':builtin_hafıza_bilgisi ,
+}
+
+# --- Helpers ---
+class Unset :
+# type of UNSET; pickles as a reference to it, so a cached tree still holds the same object
+    __slots__ =()
+
+    def __reduce__ (self ):
+        return 'UNSET'
+
+UNSET =Unset ()# value of a function local that hasn't been assigned yet
+
+class UserFunction :
+    """A defined 'işi'. Parameters and every variable the body assigns get a
+    fixed slot, so a call's variables live in a list instead of a dict.
+    memo is the result cache of a 'hafızalı' function, else None."""
+    __slots__ =('name','params','body','slots','unset','exprs','memo')
+
+    def __init__ (self ,name ,params ,body ,memo_size =None ):
+        self .name =name 
+        self .params =params 
+        self .body =body 
+        self .memo =None if memo_size is None else Memo (memo_size )
+        # parameters take the first slots in call order (a repeated name keeps the last one)
+        self .slots ={p :i for i ,p in enumerate (params )}
+        size =len (params )
+        for var in local_names (body ):
+            if var not in self .slots :
+                self .slots [var ]=size 
+                size +=1 
+        self .unset =[UNSET ]*(size -len (params ))# initial values of the slots after the parameters
+        self .exprs ={}# expression text -> compile_slot_expr() result, emptied at EXPR_CACHE_SIZE entries
+
+    def __getstate__ (self ):
+    # the readers in exprs are functions; they are compiled again where this is unpickled
+        state ={name :getattr (self ,name )for name in self .__slots__ }
+        state ['exprs']={}
+        return None ,state 
+
+class Frame :
+    """Variables of one call of a UserFunction. names holds variables without a
+    slot (set by statements the slot layout doesn't know about), None until needed."""
+    __slots__ =('function','values','names','result')
+
+    def __init__ (self ,function ,values ):
+        self .function =function 
+        self .values =values 
+        self .names =None 
+        self .result =None # value of the 'dön' that ended the call
+
+class Memo :
+    """Results of a 'hafızalı' function by argument tuple. Holds at most size
+    results, dropping the least recently used one first."""
+    __slots__ =('results','size','hits','misses')
+
+    def __init__ (self ,size ):
+        self .results =collections .OrderedDict ()
+        self .size =size 
+        self .hits =0 
+        self .misses =0 
+
+    def key (self ,args ):
+    # args as a cache key, None when they can't be one (e.g. a list argument)
+        key =tuple (args )
+        try :
+            hash (key )
+        except TypeError :
+            self .misses +=1 
+            return None 
+        return key 
+
+    def lookup (self ,key ):
+    # the stored result for key, else UNSET
+        value =self .results .get (key ,UNSET )
+        if value is UNSET :
+            self .misses +=1 
+        else :
+            self .hits +=1 
+            self .results .move_to_end (key )
+        return value 
+
+    def store (self ,key ,value ):
+        self .results [key ]=value 
+        if len (self .results )>self .size :
+            self .results .popitem (last =False )
+
+def local_names (nodes ):
+# variables assigned in a function body, not counting nested function definitions
+    names =[]
+    for node in nodes :
+        names .extend (getattr (node ,attr )for attr in node .targets )
+        if isinstance (node ,If ):
+            for _ ,body in node .clauses :
+                names +=local_names (body )
+            if node .else_body is not None :
+                names +=local_names (node .else_body )
+        elif not isinstance (node ,FuncDef )and hasattr (node ,'body'):
+            names +=local_names (node .body )
+    return names 
+
+def current_frame ():
+    return env [-1 ]
+
+def new_frame (function ,arg_values ):
+# parameters first (missing arguments are None, extra ones are dropped), then the other locals
+    n =len (function .params )
+    if len (arg_values )!=n :
+        arg_values =(arg_values +[None ]*n )[:n ]
+    return Frame (function ,arg_values +function .unset )
+
+def depth_error ():
+    return RuntimeError (f"Çok derin özyineleme: çağrı derinliği {MAX_CALL_DEPTH} sınırını aştı (--derinlik=N ile değiştirilebilir)")
+
+def push_frame (frame ,name =None ):
+    if len (env )>MAX_CALL_DEPTH :
+        raise depth_error ()
+    env .append (frame )
+    call_trace .append ({'name':name or '<anon>','line':None })
+
+def pop_frame ():
+    env .pop ()
+    call_trace .pop ()
+
+def set_var (name ,value ):
+    frame =env [-1 ]
+    if frame .__class__ is not Frame :
+        frame [name ]=value 
+        return 
+    slot =frame .function .slots .get (name )
+    if slot is not None :
+        frame .values [slot ]=value 
+    else :
+        if frame .names is None :
+            frame .names ={}
+        frame .names [name ]=value 
+
+def get_var (name ,default =None ):
+# resolve a name like an expression does: current frame, then globals, then built-ins
+    frame =env [-1 ]
+    if frame .__class__ is Frame :
+        slot =frame .function .slots .get (name )
+        if slot is not None and frame .values [slot ]is not UNSET :
+            return frame .values [slot ]
+        if frame .names and name in frame .names :
+            return frame .names [name ]
+    elif name in frame :
+        return frame [name ]
+    if name in env [0 ]:
+        return env [0 ][name ]
+    return builtin_functions .get (name ,default )
+
+def frame_locals (frame ):
+# name -> value view of a Frame, for expressions that can't read slots directly
+    values =frame .values 
+    names ={name :values [slot ]for name ,slot in frame .function .slots .items ()if values [slot ]is not UNSET }
+    if frame .names :
+        names .update (frame .names )
+    return names 
+
+    # split top-level comma-separated args (handles parentheses nesting)
+def split_args (s :str ):
+    parts ,buf ,depth =[],[],0 
+    i =0 
+    while i <len (s ):
+        ch =s [i ]
+        if ch =='(':
+            depth +=1 ;buf .append (ch )
+        elif ch ==')':
+            depth =max (0 ,depth -1 );buf .append (ch )
+        elif ch ==','and depth ==0 :
+            parts .append (''.join (buf ).strip ());buf =[]
+        else :
+            buf .append (ch )
+        i +=1 
+    if buf :
+        parts .append (''.join (buf ).strip ())
+    return [p for p in parts if p !='']
+
+    # Match every block opener with the line that ends its body, in one pass.
+def block_ends (lines ):
+    """
+    Map the index of each block opener (a line ending with ':') to the index of
+    the line that closes its body: the matching 'bitir', or for an 'ise:' clause
+    the next 'yoksa ... ise:' / 'yoksa:' of the same chain.
+    'yoksa' lines that don't follow an 'ise:' clause are ignored, and openers
+    without a matching 'bitir' end at len(lines).
+    The parser computes this once per program instead of re-scanning each body.
+    """
+    ends ,stack ={},[]
+    for idx ,raw in enumerate (lines ):
+        ln =raw .strip ()
+        if ln .startswith ("//"):
+            continue 
+        if ELSE_RE .match (ln ):
+            if stack and lines [stack [-1 ]].strip ().endswith (" ise:"):
+                ends [stack .pop ()]=idx 
+                stack .append (idx )
+        elif ln =='bitir':
+            if stack :
+                ends [stack .pop ()]=idx 
+        elif ln .endswith (':'):
+            stack .append (idx )
+    for idx in stack :
+        ends [idx ]=len (lines )
+    return ends 
+
+    # parse user input into int/float/bool/string (supports Turkish 'doğru'/'yanlış')
+def parse_input_value (s :str ):
+    s =s .strip ()
+    low =s .lower ()
+    if low =='true'or low =='doğru':
+        return True 
+    if low =='false'or low =='yanlış':
+        return False 
+    if re .fullmatch (r'[+-]?\d+',s ):
+        return int (s )
+    if re .fullmatch (r'[+-]?\d+\.\d*',s ):
+        return float (s )
+    return s 
+
+class TextBuilder :
+    """Text built up piece by piece ('metin_oluşturucu()'). The pieces are only
+    joined when the text is needed (printing, writing, comparing), and b + x
+    reuses b's piece list when nothing was added after b, so a loop of
+    'rapor eşittir rapor + satır' appends instead of copying the whole text."""
+    __slots__ =('chunks','count','text')
+
+    def __init__ (self ,chunks =None ,count =0 ):
+        self .chunks =[]if chunks is None else chunks # may be shared with later builders
+        self .count =count # chunks[:count] is this builder's text
+        self .text =None # the joined text, once needed
+
+    def own_chunks (self ):
+    # the piece list, copied first if a later builder has added to it
+        if self .count !=len (self .chunks ):
+            self .chunks =self .chunks [:self .count ]
+        return self .chunks 
+
+    def append (self ,value ):
+    # 'b.ekle(x)': add to b itself, like a list
+        self .own_chunks ().append (value if value .__class__ is str else str (value ))
+        self .count +=1 
+        self .text =None 
+
+    def plus (self ,value ):
+    # b + x: a new builder, b keeps its text
+        chunks =self .own_chunks ()
+        chunks .append (value if value .__class__ is str else str (value ))
+        return TextBuilder (chunks ,self .count +1 )
+
+    def __str__ (self ):
+        if self .text is None :
+            self .text =''.join (self .chunks [:self .count ])
+        return self .text 
+
+    def __repr__ (self ):
+        return repr (str (self ))
+
+    def __len__ (self ):
+        return len (str (self ))
+
+    def __contains__ (self ,part ):
+        return (str (part )if part .__class__ is TextBuilder else part )in str (self )
+
+    def __getitem__ (self ,key ):
+        return str (self )[key ]
+
+    def __iter__ (self ):
+        return iter (str (self ))
+
+    def compare (self ,other ,op ):
+    # op on the texts, for comparisons with text or another builder
+        if isinstance (other ,(str ,TextBuilder )):
+            return op (str (self ),str (other ))
+        return NotImplemented 
+
+    def __eq__ (self ,other ):
+        return self .compare (other ,operator .eq )
+
+    def __lt__ (self ,other ):
+        return self .compare (other ,operator .lt )
+
+    def __le__ (self ,other ):
+        return self .compare (other ,operator .le )
+
+    def __gt__ (self ,other ):
+        return self .compare (other ,operator .gt )
+
+    def __ge__ (self ,other ):
+        return self .compare (other ,operator .ge )
+
+    __hash__ =None 
+
+    # safe plus: numbers add, anything with text concatenates as text.
+    # The operation is picked from the operand types up front, so mixed
+    # text/number operands don't go through a failing '+' first.
+NUMBER_TYPES =frozenset ((int ,float ,bool ))
+
+def add_text (a ,b ):
+    return str (a )+str (b )
+
+def add_any (a ,b ):
+# types without a rule of their own: Python's '+' if it works, else text
+    try :
+        return a +b 
+    except Exception :
+        return str (a )+str (b )
+
+def add_operation (ta ,tb ):
+# the function that adds an operand of type ta to one of type tb
+    if ta is TextBuilder :
+        return TextBuilder .plus 
+    if ta is str or tb is str or tb is TextBuilder :
+        return operator .add if ta is tb else add_text 
+    if ta in NUMBER_TYPES and tb in NUMBER_TYPES :
+        return operator .add 
+    return add_any 
+
+def kv_add (a ,b ):
+    return add_operation (a .__class__ ,b .__class__ )(a ,b )
+
+def add_site ():
+    """kv_add for one '+' in the source (an inline cache): it remembers the
+    operand types it last saw and their operation, so a '+' that keeps
+    seeing the same types skips the type checks."""
+    seen_a =seen_b =None 
+    op =None 
+
+    def add (a ,b ):
+        nonlocal seen_a ,seen_b ,op 
+        ta ,tb =a .__class__ ,b .__class__ 
+        if ta is not seen_a or tb is not seen_b :
+            seen_a ,seen_b ,op =ta ,tb ,add_operation (ta ,tb )
+        return op (a ,b )
+    return add 
+
+ADD_SITE_CODE =add_site ().__code__ 
+ADD_SITE ='\0kv_add'# numbered, the constant AddTransformer calls in place of an add_site()
+
+def is_add_site (node ):
+    return isinstance (node ,ast .Constant )and node .value .__class__ is str and node .value .startswith (ADD_SITE )
+
+def with_add_sites (code ):
+    """code with each ADD_SITE constant, in it or in the code nested in it,
+    replaced by a new add_site(). The sites are constants of the code object,
+    so they go away with it."""
+    consts =[]
+    for c in code .co_consts :
+        if c .__class__ is str and c .startswith (ADD_SITE ):
+            c =add_site ()
+        elif c .__class__ is code .__class__ :
+            c =with_add_sites (c )
+        consts .append (c )
+    if all (a is b for a ,b in zip (consts ,code .co_consts )):
+        return code 
+    return code .replace (co_consts =tuple (consts ))
+
+def without_add_sites (code ,count =None ):
+# with_add_sites() undone, for marshal: each site back to an ADD_SITE constant
+    count =count or [0 ]
+    consts =[]
+    for c in code .co_consts :
+        if getattr (c ,'__code__',None )is ADD_SITE_CODE :
+            count [0 ]+=1 
+            c =f"{ADD_SITE}{count[0]}"
+        elif c .__class__ is code .__class__ :
+            c =without_add_sites (c ,count )
+        consts .append (c )
+    if all (a is b for a ,b in zip (consts ,code .co_consts )):
+        return code 
+    return code .replace (co_consts =tuple (consts ))
+
+    # AST transform for '+': operands whose type is known from the source
+    # (literals and what is built from them) get a plain '+' or a text
+    # concatenation; other '+' become calls of an ADD_SITE constant, which
+    # compile_tree() turns into an add_site().
+class AddTransformer (ast .NodeTransformer ):
+    def __init__ (self ):
+        self .sites =0 
+
+    def kind (self ,node ):
+    # 'num' or 'str' when the value's type is known up front, else None
+        if isinstance (node ,ast .Constant ):
+            if node .value .__class__ is str :
+                return 'str'
+            if node .value .__class__ in NUMBER_TYPES :
+                return 'num'
+        elif isinstance (node ,ast .UnaryOp )and isinstance (node .op ,(ast .UAdd ,ast .USub )):
+            return 'num'if self .kind (node .operand )=='num'else None 
+        return getattr (node ,'kv_kind',None )
+
+    def as_text (self ,node ,kind ):
+        if kind =='str':
+            return node 
+        if isinstance (node ,ast .Constant ):
+            return ast .copy_location (ast .Constant (str (node .value )),node )
+        return ast .Call (ast .Name ('kv_str',ast .Load ()),[node ],[])
+
+    def visit_BinOp (self ,node ):
+        self .generic_visit (node )
+        left ,right =self .kind (node .left ),self .kind (node .right )
+        if not isinstance (node .op ,ast .Add ):
+            if left ==right =='num':
+                node .kv_kind ='num'
+            return node 
+        if left is not None and left ==right :
+            node .kv_kind =left 
+            return node 
+        if left =='str'or (right =='str'and left =='num'):
+        # text with anything else (a number, or an unknown on the right) is text
+            new =ast .BinOp (self .as_text (node .left ,left ),ast .Add (),self .as_text (node .right ,right ))
+            new .kv_kind ='str'
+            return ast .copy_location (new ,node )
+        self .sites +=1 
+        return ast .copy_location (
+        ast .Call (func =ast .Constant (f"{ADD_SITE}{self.sites}"),args =[node .left ,node .right ],keywords =[]),
+        node 
+        )
+
+        # translate Turkish operators/keywords inside expressions to Python
+        # NOTE: This function expects input where string literals have been replaced
+        # with placeholders, so it can safely translate without toüçhing string content.
+def translate_ops (e :str ):
+# relational phrases first (keep flexible)
+    e =re .sub (r'(\S+)\s+(\S+)\s+eşit\b',r'\1 == \2',e )
+    e =re .sub (r'(\S+)\s+(\S+)\s+farklı\b',r'\1 != \2',e )
+    e =re .sub (r'\beşit\b','==',e )
+    e =re .sub (r'\bfarklı\b','!=',e )
+    e =re .sub (r'\bküçüktür\b','<',e )
+    e =re .sub (r'\bbüyüktür\b','>',e )
+    # boolean literals (Turkish)
+    e =re .sub (r'\bdoğru\b','True',e )
+    e =re .sub (r'\byanlış\b','False',e )
+    # logical operators
+    e =re .sub (r'\bve\b','and',e )
+    e =re .sub (r'\bveya\b','or',e )
+    e =re .sub (r'\bdeğil\b','not',e )
+    return e 
+
+    # Helper: replace string literals with placeholders so translators don't toüçh them
+def shield_strings (expr :str ):
+    """
+    Replace string literals with placeholders.
+    Returns (shielded_expr, placeholders_list)
+    placeholders_list is list of original string literals in order: ['"abc"', "'a\\'b'"]
+    Note: pattern intentionally does NOT treat backslashes as escapes. Kavun
+    strings may contain raw backslashes (even before the closing quote).
+    """
+    # Use a simple "match until next same-quote" pattern so we do not treat \ as escape.
+    pattern =re .compile (r'(\"[^\"]*\"|\'[^\']*\')',re .UNICODE )
+    placeholders =[]
+    def repl (m ):
+        placeholders .append (m .group (0 ))
+        return f"__KAVUN_STR_{len(placeholders)-1}__"
+    shielded =pattern .sub (repl ,expr )
+    return shielded ,placeholders 
+
+def restore_strings (expr :str ,placeholders ):
+# Replace placeholders with safe Python string literals using repr to
+# preserve backslashes and quotes exactly as intended by the user.
+    for i ,s in enumerate (placeholders ):
+        inner =s [1 :-1 ]# remove surrounding quotes
+        expr =expr .replace (f"__KAVUN_STR_{i}__",repr (inner ))
+    return expr 
+
+def unshield_strings (expr :str ,placeholders ):
+# Put the original string literals back, e.g. into call arguments that are evaluated on their own
+    for i ,s in enumerate (placeholders ):
+        expr =expr .replace (f"__KAVUN_STR_{i}__",s )
+    return expr 
+
+def split_call (shielded ,placeholders ):
+# (fname, arg_exprs) when the whole string-shielded expression is a call, else None
+
+# 1) Call style: "<args> ile <fname> işi"
+    m =re .match (r'^(?P<args>.+?)\s+ile\s+(?P<fname>\w+)\s+işi$',shielded )
+    if not m :
+    # 2) Call style: "iş <fname>(arg1, arg2, ...)"
+        m =re .match (r'^iş\s+(?P<fname>\w+)\s*\((?P<args>.*)\)\s*$',shielded )
+    if m :
+        raw_args =m .group ('args').strip ()
+        arg_exprs =[unshield_strings (a ,placeholders )for a in split_args (raw_args )]if raw_args else []
+        return m .group ('fname'),arg_exprs 
+    return None 
+
+class CallExpr :
+    """A user-function call expression, with the calls among its arguments
+    split out too, so run_block can start them without going through evaluate()."""
+    __slots__ =('fname','args','arg_calls')
+
+    def __init__ (self ,fname ,args ):
+        self .fname =fname 
+        self .args =args 
+        self .arg_calls =[call_of (a )for a in args ]# CallExpr or None per argument
+
+def call_of (expr ):
+# the CallExpr of an expression that is a user-function call, else None
+    if expr is None :
+        return None 
+    call =split_call (*shield_strings (expr .strip ()))
+    return None if call is None else CallExpr (*call )
+
+    # Run the whole expression front-end for a raw Kavun expression.
+    # Returns (tree, None) for Python-like expressions, where tree is the translated
+    # ast.Expression, or (None, (fname, arg_exprs)) for the two function call styles.
+def parse_expr (expr :str ):
+    e =expr .strip ()
+    shielded ,placeholders =shield_strings (e )
+    call =split_call (shielded ,placeholders )
+    if call is not None :
+        return None ,call 
+
+        # 3) Translate Turkish ops and apply the AST transform (kv_add)
+    translated =translate_ops (shielded )
+    # restore string literals into safe Python string literals
+    translated =restore_strings (translated ,placeholders )
+    try :
+        tree =ast .parse (translated ,'<kavun-expr>',mode ='eval')
+    except Exception as ex2 :
+        raise RuntimeError (f"Geçersiz ifade [{expr}]: {ex2}")
+    add =AddTransformer ()
+    tree =add .visit (tree )
+    tree .kv_sites =add .sites 
+    ast .fix_missing_locations (tree )
+    return tree ,None 
+
+def compile_tree (tree ,sites ):
+# compile an expression tree with its '+' sites; CPython warns about calling
+# the ADD_SITE constants, which only stand in for the add_site()s
+    if not sites :
+        return compile (tree ,'<kavun-expr>','eval')
+    with warnings .catch_warnings ():
+        warnings .simplefilter ('ignore',SyntaxWarning )
+        return with_add_sites (compile (tree ,'<kavun-expr>','eval'))
+
+        # Like parse_expr, but with the tree compiled: (code_obj, None) or (None, (fname, arg_exprs)).
+def compile_expr (expr :str ):
+    tree ,call =parse_expr (expr )
+    if call is not None :
+        return None ,call 
+    return compile_tree (tree ,tree .kv_sites ),None 
+
+    # Names an expression sees after its own frame and the global frame: Kavun
+    # built-ins, kv_str and friends and Python's built-ins. Installed as the global frame's
+    # __builtins__ so eval() resolves local -> global -> built-in without copying.
+eval_builtins =dict (vars (builtins ))
+eval_builtins .update (builtin_functions )
+eval_builtins ['kv_add']=kv_add 
+eval_builtins ['kv_str']=str 
+env [0 ]['__builtins__']=eval_builtins 
+
+# A function local read before the function assigns it falls back to the
+# global, as the name lookup of a dict frame did.
+def kv_global (name ):
+    if name in env [0 ]:
+        return env [0 ][name ]
+    if name in eval_builtins :
+        return eval_builtins [name ]
+    raise NameError (f"name '{name}' is not defined")
+
+eval_builtins ['kv_global']=kv_global 
+eval_builtins ['kv_unset']=UNSET 
+
+class SlotReads (ast .NodeTransformer ):
+# rewrite reads of a function's variables into reads of its slot list
+    def __init__ (self ,slots ):
+        self .slots =slots 
+
+    def visit_Name (self ,node ):
+        slot =self .slots .get (node .id )
+        if slot is None or not isinstance (node .ctx ,ast .Load ):
+            return node 
+        read =ast .parse (f"(kv_v if (kv_v := kv_slots[{slot}]) is not kv_unset else kv_global({node.id!r}))",mode ='eval').body 
+        return ast .copy_location (read ,node )
+
+SCOPED_EXPRS =(ast .ListComp ,ast .SetComp ,ast .DictComp ,ast .GeneratorExp ,ast .Lambda ,ast .NamedExpr )
+
+# Front-end for expressions inside a function: (read, None), where read(values)
+# evaluates the expression against a Frame's slot list, or (None, call) for
+# calls. read is None when the expression binds names of its own
+# (comprehensions, lambdas, ':='); those are evaluated against frame_locals().
+def compile_slot_expr (expr :str ,slots ):
+    key =(expr ,tuple (slots .items ()))
+    entry =slot_codes .get (key )
+    if entry is None :
+        entry =slot_codes .lookup (key )
+    else :
+        slot_codes .hits +=1 
+    code ,call =entry 
+    if code is None :
+        return None ,call 
+    return eval (code ,env [0 ]),None 
+
+    # (code, None) for compile_slot_expr(), where code builds its reader, (None, call) or (None, None)
+def slot_expr_code (expr ,slots ):
+    tree ,call =parse_expr (expr )
+    if call is not None :
+        return None ,call 
+    if any (isinstance (n ,SCOPED_EXPRS )for n in ast .walk (tree )):
+        return None ,None 
+    sites =tree .kv_sites 
+    body =SlotReads (slots ).visit (tree .body )
+    args =ast .arguments (posonlyargs =[],args =[ast .arg ('kv_slots')],kwonlyargs =[],kw_defaults =[],defaults =[])
+    tree =ast .fix_missing_locations (ast .Expression (ast .Lambda (args ,body )))
+    return compile_tree (tree ,sites ),None 
+
+    # evaluate an expression (supports both call styles and Python-like expressions)
+def evaluate (expr :str ):
+    frame =env [-1 ]
+    in_function =frame .__class__ is Frame 
+    if in_function :
+        exprs =frame .function .exprs 
+        entry =exprs .get (expr )
+        if entry is None :
+            if len (exprs )>=EXPR_CACHE_SIZE :
+                exprs .clear ()
+            entry =exprs [expr ]=compile_slot_expr (expr ,frame .function .slots )
+        else :
+            slot_codes .hits +=1 
+    else :
+        entry =expr_cache .get (expr )
+        if entry is None :
+            entry =expr_cache .lookup (expr )
+        else :
+            expr_cache .hits +=1 
+    compiled ,call =entry 
+
+    if call is not None :
+        fname ,arg_exprs =call 
+        if fname not in functions :
+            raise RuntimeError (f"Tanınmayan fonksiyon: {fname}")
+        return call_function (fname ,[evaluate (a )for a in arg_exprs ])
+
+    try :
+        if not in_function :
+            return eval (compiled ,env [0 ],frame )
+        if compiled is not None and frame .names is None :
+            return compiled (frame .values )
+            # fall back to a name -> value view of the frame
+        entry =expr_cache .get (expr )
+        if entry is None :
+            entry =expr_cache .lookup (expr )
+        else :
+            expr_cache .hits +=1 
+        return eval (entry [0 ],env [0 ],frame_locals (frame ))
+    except Exception as ex :
+        raise RuntimeError (f"İfade değerlendirme hatası [{expr}]: {ex}")
+
+        # call a user function by name (simple dispatcher)
+def call_function (fname ,arg_values ):
+    if fname not in functions :
+        raise RuntimeError (f"Tanınmayan fonksiyon: {fname}")
+    frame =new_frame (functions [fname ],arg_values )
+    memo =frame .function .memo 
+    if memo is not None :
+        key =memo .key (frame .values [:len (frame .function .params )])
+        if key is not None :
+            value =memo .lookup (key )
+            if value is not UNSET :
+                return value 
+    push_frame (frame ,name =fname )
+    try :
+        status =run_block (frame .function .body )
+    except RecursionError :
+    # calls run_block can't keep on its own stack (e.g. in conditions) still nest in Python's
+        raise RuntimeError (f"Çok derin özyineleme: {fname} çağrıları Python yığınını doldurdu")from None 
+    finally :
+        pop_frame ()
+    raise_status (status )
+    if memo is not None and key is not None :
+        memo .store (key ,frame .result )
+    return frame .result 
+
+    # --- Statement tree ---
+    # A program is parsed once into these nodes; run_block only walks them.
+    # Every node keeps its 1-based source line for error messages and call_trace.
+class Stmt :
+    __slots__ =('line',)
+    targets =()# names of the attributes holding variables the statement assigns
+    call =None # CallExpr when the statement's value comes from a user-function call (run by run_block)
+
+    def __init__ (self ,line ):
+        self .line =line 
+
+class Clear (Stmt ):# 'temizle'
+    __slots__ =()
+
+class NewLine (Stmt ):# 'yeni_satır'
+    __slots__ =()
+
+class Sleep (Stmt ):# 'X saniye bekle'
+    __slots__ =('seconds',)
+
+    def __init__ (self ,line ,seconds ):
+        super ().__init__ (line )
+        self .seconds =seconds 
+
+class ListCreate (Stmt ):# 'liste eşittir [a, b]'
+    __slots__ =('var','elements')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,elements ):
+        super ().__init__ (line )
+        self .var =var 
+        self .elements =elements 
+
+class ListGet (Stmt ):# 'eleman eşittir liste[0]'
+    __slots__ =('var','list_name','index')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,list_name ,index ):
+        super ().__init__ (line )
+        self .var =var 
+        self .list_name =list_name 
+        self .index =index 
+
+class ListSet (Stmt ):# 'liste[0] eşittir ifade'
+    __slots__ =('list_name','index','expr')
+    targets =('list_name',)
+
+    def __init__ (self ,line ,list_name ,index ,expr ):
+        super ().__init__ (line )
+        self .list_name =list_name 
+        self .index =index 
+        self .expr =expr 
+
+class ListAppend (Stmt ):# 'liste.ekle(ifade)'
+    __slots__ =('list_name','expr')
+    targets =('list_name',)
+
+    def __init__ (self ,line ,list_name ,expr ):
+        super ().__init__ (line )
+        self .list_name =list_name 
+        self .expr =expr 
+
+class ListRemove (Stmt ):# 'liste.sil(0)'
+    __slots__ =('list_name','index')
+    targets =('list_name',)
+
+    def __init__ (self ,line ,list_name ,index ):
+        super ().__init__ (line )
+        self .list_name =list_name 
+        self .index =index 
+
+class TextOp (Stmt ):# 'metin.uzunluk()', 'metin.büyük_harf()', 'metin.küçük_harf()'
+    __slots__ =('var','target','op')
+    targets =('target',)
+
+    def __init__ (self ,line ,var ,target ,op ):
+        super ().__init__ (line )
+        self .var =var 
+        self .target =target 
+        self .op =op 
+
+class FileRead (Stmt ):# 'dosya_oku("dosya.txt")'
+    __slots__ =('path',)
+    var ="dosya_içerik"
+    targets =('var',)
+
+    def __init__ (self ,line ,path ):
+        super ().__init__ (line )
+        self .path =path 
+
+class FileWrite (Stmt ):# 'dosya_yaz("dosya.txt", içerik)'
+    __slots__ =('path','expr')
+
+    def __init__ (self ,line ,path ,expr ):
+        super ().__init__ (line )
+        self .path =path 
+        self .expr =expr 
+
+class DirList (Stmt ):# 'klasör_listesi()'
+    __slots__ =()
+    var ="dosya_listesi"
+    targets =('var',)
+
+class SetBuiltin (Stmt ):# 'şimdi()', 'tarih()', 'saat()', 'rastgele_sayı()'
+    __slots__ =('var','func')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,func ):
+        super ().__init__ (line )
+        self .var =var 
+        self .func =func 
+
+class RandomRange (Stmt ):# '1 ile 10 arasi_rastgele()', 'x eşittir 1 ile 10 arasi_rastgele()'
+    __slots__ =('var','low','high')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,low ,high ):
+        super ().__init__ (line )
+        self .var =var 
+        self .low =low 
+        self .high =high 
+
+class ColorPrint (Stmt ):# 'metin kırmızı_yaz', ..., 'metin animasyonlu_yaz'
+    __slots__ =('expr','func','label')
+
+    def __init__ (self ,line ,expr ,func ,label ):
+        super ().__init__ (line )
+        self .expr =expr 
+        self .func =func 
+        self .label =label 
+
+class AnimationStop (Stmt ):# 'animasyon_durdur'
+    __slots__ =()
+
+class Draw (Stmt ):# 'üçgen_çiz(5)', 'kare_çiz(4)', 'kalp_çiz()'
+    __slots__ =('func','args','label')
+
+    def __init__ (self ,line ,func ,args ,label ):
+        super ().__init__ (line )
+        self .func =func 
+        self .args =args 
+        self .label =label 
+
+class Graph (Stmt ):# 'grafik_çiz([1, 3, 2])'
+    __slots__ =('elements',)
+
+    def __init__ (self ,line ,elements ):
+        super ().__init__ (line )
+        self .elements =elements 
+
+class DictCreate (Stmt ):# 'sözlük eşittir {"a": 1}'
+    __slots__ =('var','pairs')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,pairs ):
+        super ().__init__ (line )
+        self .var =var 
+        self .pairs =pairs 
+
+class DictGet (Stmt ):# 'eleman eşittir sözlük["anahtar"]'
+    __slots__ =('var','dict_name','key')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,dict_name ,key ):
+        super ().__init__ (line )
+        self .var =var 
+        self .dict_name =dict_name 
+        self .key =key 
+
+class DictSet (Stmt ):# 'sözlük["anahtar"] eşittir ifade'
+    __slots__ =('dict_name','key','expr')
+    targets =('dict_name',)
+
+    def __init__ (self ,line ,dict_name ,key ,expr ):
+        super ().__init__ (line )
+        self .dict_name =dict_name 
+        self .key =key 
+        self .expr =expr 
+
+class Break (Stmt ):# 'kır'
+    __slots__ =()
+
+class Continue (Stmt ):# 'devam'
+    __slots__ =()
+
+class Return (Stmt ):# 'dön' or '<ifade> dön'
+    __slots__ =('expr','call')
+
+    def __init__ (self ,line ,expr =None ):
+        super ().__init__ (line )
+        self .expr =expr 
+        self .call =call_of (expr )# CallExpr when the value is a user-function call
+
+class Assign (Stmt ):# 'x eşittir ifade' or 'x = ifade'
+    __slots__ =('var','expr','call')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,expr ):
+        super ().__init__ (line )
+        self .var =var 
+        self .expr =expr 
+        self .call =call_of (expr )
+
+class Input (Stmt ):# 'x eşittir cevap()'
+    __slots__ =('var',)
+    targets =('var',)
+
+    def __init__ (self ,line ,var ):
+        super ().__init__ (line )
+        self .var =var 
+
+class Print (Stmt ):# '<ifade> yaz'
+    __slots__ =('expr','call')
+
+    def __init__ (self ,line ,expr ):
+        super ().__init__ (line )
+        self .expr =expr 
+        self .call =call_of (expr )
+
+class CallStmt (Stmt ):# 'a, b ile f işi' or 'iş f(a, b)' used as a statement
+    __slots__ =('expr','call')
+
+    def __init__ (self ,line ,expr ):
+        super ().__init__ (line )
+        self .expr =expr 
+        self .call =call_of (expr )
+
+class If (Stmt ):# '<koşul> ise:' ... 'yoksa <koşul> ise:' ... 'yoksa:' ... 'bitir'
+    __slots__ =('clauses','else_body')
+
+    def __init__ (self ,line ,clauses ,else_body ):
+        super ().__init__ (line )
+        self .clauses =clauses # [(condition, body), ...]
+        self .else_body =else_body 
+
+class While (Stmt ):# '<koşul> iken:' ... 'bitir'
+    __slots__ =('cond','body')
+
+    def __init__ (self ,line ,cond ,body ):
+        super ().__init__ (line )
+        self .cond =cond 
+        self .body =body 
+
+class For (Stmt ):# 'i için X den Y kadar:' ... 'bitir'
+    __slots__ =('var','low','high','body')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,low ,high ,body ):
+        super ().__init__ (line )
+        self .var =var 
+        self .low =low 
+        self .high =high 
+        self .body =body 
+
+class ForLines (Stmt ):# 'satır için "dosya.txt" satırları:' ... 'bitir'
+    __slots__ =('var','path','body')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,path ,body ):
+        super ().__init__ (line )
+        self .var =var 
+        self .path =path # expression giving the file name
+        self .body =body 
+
+class ParallelFor (Stmt ):# 'i için X den Y kadar paralel:' ... 'bitir'
+    __slots__ =('var','low','high','body','results','serial')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,low ,high ,body ):
+        super ().__init__ (line )
+        self .var =var 
+        self .low =low 
+        self .high =high 
+        self .body =body 
+        self .results =accumulations (body )# (variable, kind) the workers send back
+        self .serial =For (line ,var ,low ,high ,body )# the same loop, for when it can't go to workers
+
+class Accumulate (Stmt ):# 'toplam toplamına ifade ekle', 'liste listesine ifade ekle'
+    __slots__ =('var','expr','kind')
+    targets =('var',)
+
+    def __init__ (self ,line ,var ,expr ,kind ):
+        super ().__init__ (line )
+        self .var =var 
+        self .expr =expr 
+        self .kind =kind # 'toplam' or 'liste'
+
+def accumulations (nodes ):
+# (variable, kind) of the Accumulate statements in a block, nested blocks included
+    found =[]
+    for node in nodes :
+        if isinstance (node ,Accumulate ):
+            if (node .var ,node .kind )not in found :
+                found .append ((node .var ,node .kind ))
+        elif isinstance (node ,If ):
+            for _ ,body in node .clauses :
+                found +=[a for a in accumulations (body )if a not in found ]
+            found +=[a for a in accumulations (node .else_body or [])if a not in found ]
+        elif not isinstance (node ,FuncDef )and hasattr (node ,'body'):
+            found +=[a for a in accumulations (node .body )if a not in found ]
+    return found 
+
+class FuncDef (Stmt ):# 'a, b ile topla işi:' ... 'bitir', 'hafızalı n ile fib işi:' ... 'bitir'
+    __slots__ =('name','params','body','function')
+
+    def __init__ (self ,line ,name ,params ,body ,memo_size =None ):
+        super ().__init__ (line )
+        self .name =name 
+        self .params =params 
+        self .body =body 
+        self .function =UserFunction (name ,params ,body ,memo_size )
+
+class Unknown (Stmt ):# anything else, reported when reached
+    __slots__ =('text',)
+
+    def __init__ (self ,line ,text ):
+        super ().__init__ (line )
+        self .text =text 
+
+        # --- Parser ---
+ELSE_RE =LazyPattern (r'^yoksa(?:\s+.+?\s+ise)?:$')
+IF_RE =LazyPattern (r'^(?:yoksa\s+)?(.+?)\s+ise:$')
+WHILE_RE =LazyPattern (r'^(.+?)\s+iken:$')
+FOR_RE =LazyPattern (r'^(\w+)\s+için\s+([+-]?\d+)\s+den\s+([+-]?\d+)\s+kadar:$')
+PARALLEL_FOR_RE =LazyPattern (r'^(\w+)\s+için\s+([+-]?\d+)\s+den\s+([+-]?\d+)\s+kadar\s+paralel:$')
+FOR_LINES_RE =LazyPattern (r'^(\w+)\s+için\s+(.+?)\s+satırları:$')
+FUNC_DEF_RE =LazyPattern (r'^(.+?)\s+ile\s+(.+?)\s+işi:$')
+MEMO_FUNC_DEF_RE =LazyPattern (r'^hafızalı(?:\((\d+)\))?\s+(.+?)\s+ile\s+(.+?)\s+işi:$')
+
+def parse_elements (s ):
+    s =s .strip ()
+    return [e .strip ()for e in split_args (s )]if s else []
+
+def parse_dict_pairs (pairs_str ):
+# Basit sözlük parsing
+    pairs =[]
+    current_key =None 
+    in_quotes =False 
+    quote_char =None 
+    buffer =""
+
+    for char in pairs_str :
+        if char in ['"',"'"]and not in_quotes :
+            in_quotes =True 
+            quote_char =char 
+            buffer +=char 
+        elif char ==quote_char and in_quotes :
+            in_quotes =False 
+            buffer +=char 
+        elif char ==':'and not in_quotes :
+            current_key =buffer .strip ().strip ('"\'')
+            buffer =""
+        elif char ==','and not in_quotes :
+            pairs .extend ([current_key ,buffer .strip ().strip ('"\'')])
+            buffer =""
+        else :
+            buffer +=char 
+
+    if buffer .strip ():
+        pairs .extend ([current_key ,buffer .strip ().strip ('"\'')])
+    return pairs 
+
+def make_assign (m ,line ):
+    var =m .group (1 ).strip ()
+    expr =m .group (2 ).strip ()
+    if expr =="cevap()":
+        return Input (line ,var )
+    return Assign (line ,var ,expr )
+
+    # exact one-word statements
+SIMPLE_STATEMENTS ={
+"temizle":Clear ,
+"yeni_satır":NewLine ,
+"klasör_listesi()":DirList ,
+"şimdi()":lambda line :SetBuiltin (line ,"şu_an",builtin_şimdi ),
+"tarih()":lambda line :SetBuiltin (line ,"bugün",builtin_tarih ),
+"saat()":lambda line :SetBuiltin (line ,"şu_saat",builtin_saat ),
+"rastgele_sayı()":lambda line :SetBuiltin (line ,"rastgele",builtin_rastgele ),
+"animasyon_durdur":AnimationStop ,
+"kalp_çiz()":lambda line :Draw (line ,builtin_kalp_çiz ,(),"Kalp çizme hatası"),
+"kır":Break ,
+"devam":Continue ,
+"dön":Return ,
+}
+
+# Pattern statements are indexed by dispatch key, so a line is only tried
+# against the patterns registered under the keys it produces (see statement_keys).
+STATEMENT_PATTERNS =[]# every (order, pattern, build), in registration order
+STATEMENT_TABLE ={}# dispatch key -> [(order, pattern, build)]
+BLOCK_STATEMENTS ={}# trailing keyword of a block opener -> [(pattern, build)]
+HEAD_RE =LazyPattern (r'\w+')
+
+def register_statement (pattern ,build ,keys =None ):
+    """Add a one-line statement form.
+
+    build(m, line) returns the statement node for a match of pattern. keys are
+    the dispatch keys under which the pattern is tried; with None it is tried
+    on every line. When several patterns match, the one registered first wins.
+    """
+    entry =(len (STATEMENT_PATTERNS ),LazyPattern (pattern ),build )
+    STATEMENT_PATTERNS .append (entry )
+    for key in keys or ('*',):
+        STATEMENT_TABLE .setdefault (key ,[]).append (entry )
+
+def register_block (keyword ,pattern ,build ):
+    """Add a block statement whose opener ends with keyword (e.g. 'iken:').
+
+    build(m, line, body) returns the node, body being the parsed lines up to its 'bitir'.
+    """
+    BLOCK_STATEMENTS .setdefault (keyword ,[]).append ((LazyPattern (pattern ),build ))
+
+def statement_keys (line ):
+    """Dispatch keys of a line: its leading word ('dosya_yaz'), its trailing word
+    ('yaz', 'dön', 'kırmızı_yaz'), a method or index on the leading word ('.ekle',
+    '['), and for assignments 'eşittir' or '=' ('eşittir[' / 'eşittir{' / 'eşittir]'
+    when the value is a list, a dictionary or an indexed element)."""
+    keys =['*',line .rsplit (None ,1 )[-1 ]]
+    m =HEAD_RE .match (line )
+    if m :
+        head =m .group ()
+        keys .append (head )
+        after =line [m .end ():m .end ()+1 ]
+        if after =='.':
+            m =HEAD_RE .match (line ,m .end ()+1 )
+            if m :
+                keys .append ('.'+m .group ())
+        elif after =='[':
+            keys .append ('[')
+    if 'eşittir'in line :
+        value =line .partition ('eşittir')[2 ].strip ()
+        if value [:1 ]in ('[','{'):
+            keys .append ('eşittir'+value [0 ])
+        elif value .endswith (']'):
+            keys .append ('eşittir]')
+        else :
+            keys .append ('eşittir')
+    if '='in line :
+        keys .append ('=')
+    return keys 
+
+ASSIGN_KEYS =('eşittir','eşittir[','eşittir{','eşittir]','=')
+
+for pattern ,build ,keys in [
+(r'^(\d+(?:\.\d+)?)\s+saniye\s+bekle$',
+lambda m ,line :Sleep (line ,float (m .group (1 ))),('bekle',)),
+(r'^(\w+)\s+eşittir\s+\[(.*)\]$',
+lambda m ,line :ListCreate (line ,m .group (1 ),parse_elements (m .group (2 ))),('eşittir[',)),
+(r'^(\w+)\s+eşittir\s+(\w+)\[(\d+)\]$',
+lambda m ,line :ListGet (line ,m .group (1 ),m .group (2 ),int (m .group (3 ))),('eşittir]',)),
+(r'^(\w+)\[(\d+)\]\s+eşittir\s+(.+)$',
+lambda m ,line :ListSet (line ,m .group (1 ),int (m .group (2 )),m .group (3 ).strip ()),('[',)),
+(r'^(\w+)\.ekle\((.+)\)$',
+lambda m ,line :ListAppend (line ,m .group (1 ),m .group (2 ).strip ()),('.ekle',)),
+(r'^(\w+)\.sil\((\d+)\)$',
+lambda m ,line :ListRemove (line ,m .group (1 ),int (m .group (2 ))),('.sil',)),
+(r'^(\w+)\s+(toplamına|listesine)\s+(.+)\s+ekle$',
+lambda m ,line :Accumulate (line ,m .group (1 ),m .group (3 ).strip (),'toplam'if m .group (2 )=='toplamına'else 'liste'),('ekle',)),
+(r'^(\w+)\.uzunluk\(\)$',
+lambda m ,line :TextOp (line ,m .group (1 ),m .group (1 )+"_uzunluk",builtin_metin_uzunluk ),('.uzunluk',)),
+(r'^(\w+)\.büyük_harf\(\)$',
+lambda m ,line :TextOp (line ,m .group (1 ),m .group (1 )+"_büyük",builtin_büyük_harf ),('.büyük_harf',)),
+(r'^(\w+)\.küçük_harf\(\)$',
+lambda m ,line :TextOp (line ,m .group (1 ),m .group (1 )+"_küçük",builtin_küçük_harf ),('.küçük_harf',)),
+(r'^dosya_oku\("([^"]+)"\)$',
+lambda m ,line :FileRead (line ,m .group (1 )),('dosya_oku',)),
+(r'^dosya_yaz\("([^"]+)",\s*(.+)\)$',
+lambda m ,line :FileWrite (line ,m .group (1 ),m .group (2 ).strip ()),('dosya_yaz',)),
+(r'^(\d+)\s+ile\s+(\d+)\s+arasi_rastgele\(\)$',
+lambda m ,line :RandomRange (line ,"rastgele",int (m .group (1 )),int (m .group (2 ))),('arasi_rastgele()',)),
+(r'^(\w+)\s+eşittir\s+(\d+)\s+ile\s+(\d+)\s+arasi_rastgele\(\)$',
+lambda m ,line :RandomRange (line ,m .group (1 ),int (m .group (2 )),int (m .group (3 ))),('arasi_rastgele()',)),
+(r'^(.+)\s+kırmızı_yaz$',
+lambda m ,line :ColorPrint (line ,m .group (1 ).strip (),builtin_kırmızı_yaz ,"Kırmızı yazdırma hatası"),('kırmızı_yaz',)),
+(r'^(.+)\s+yeşil_yaz$',
+lambda m ,line :ColorPrint (line ,m .group (1 ).strip (),builtin_yeşil_yaz ,"Yeşil yazdırma hatası"),('yeşil_yaz',)),
+(r'^(.+)\s+sarı_yaz$',
+lambda m ,line :ColorPrint (line ,m .group (1 ).strip (),builtin_sarı_yaz ,"Sarı yazdırma hatası"),('sarı_yaz',)),
+(r'^(.+)\s+mavi_yaz$',
+lambda m ,line :ColorPrint (line ,m .group (1 ).strip (),builtin_mavi_yaz ,"Mavi yazdırma hatası"),('mavi_yaz',)),
+(r'^(.+)\s+mor_yaz$',
+lambda m ,line :ColorPrint (line ,m .group (1 ).strip (),builtin_mor_yaz ,"Mor yazdırma hatası"),('mor_yaz',)),
+(r'^(.+)\s+cyan_yaz$',
+lambda m ,line :ColorPrint (line ,m .group (1 ).strip (),builtin_cyan_yaz ,"Cyan yazdırma hatası"),('cyan_yaz',)),
+(r'^(.+)\s+animasyonlu_yaz$',
+lambda m ,line :ColorPrint (line ,m .group (1 ).strip (),builtin_animasyonlu_yaz ,"Animasyonlu yazdırma hatası"),('animasyonlu_yaz',)),
+(r'^üçgen_çiz\((\d+)\)$',
+lambda m ,line :Draw (line ,builtin_üçgen_çiz ,(int (m .group (1 )),),"Üçgen çizme hatası"),('üçgen_çiz',)),
+(r'^kare_çiz\((\d+)\)$',
+lambda m ,line :Draw (line ,builtin_kare_çiz ,(int (m .group (1 )),),"Kare çizme hatası"),('kare_çiz',)),
+(r'^grafik_çiz\(\[(.*)\]\)$',
+lambda m ,line :Graph (line ,parse_elements (m .group (1 ))),('grafik_çiz',)),
+(r'^(\w+)\s+eşittir\s+\{(.*)\}$',
+lambda m ,line :DictCreate (line ,m .group (1 ),parse_dict_pairs (m .group (2 ).strip ())),('eşittir{',)),
+(r'^(\w+)\s+eşittir\s+(\w+)\["([^"]+)"\]$',
+lambda m ,line :DictGet (line ,m .group (1 ),m .group (2 ),m .group (3 )),('eşittir]',)),
+(r'^(\w+)\["([^"]+)"\]\s+eşittir\s+(.+)$',
+lambda m ,line :DictSet (line ,m .group (1 ),m .group (2 ),m .group (3 ).strip ()),('[',)),
+(r'^(.+)\s+dön$',
+lambda m ,line :Return (line ,m .group (1 ).strip ()),('dön',)),
+# the target may not contain quotes or comparison operators, so '"a=b" yaz' and 'a >= b yaz' are not assignments
+(r'^([^"\'=<>!]+?)\s*(?:eşittir|(?<![<>=!])=(?!=))\s*(.+)$',
+make_assign ,ASSIGN_KEYS ),
+(r'^(.+)\s+yaz$',
+lambda m ,line :Print (line ,m .group (1 ).strip ()),('yaz',)),
+(r'^(.+?)\s+ile\s+(.+?)\s+işi$',
+lambda m ,line :CallStmt (line ,f"{m.group(1)} ile {m.group(2)} işi"),('işi',)),
+(r'^iş\s+(\w+)\s*\((.*)\)\s*$',
+lambda m ,line :CallStmt (line ,m .string ),('iş',)),
+]:
+    register_statement (pattern ,build ,keys )
+
+register_block ('iken:',WHILE_RE .pattern ,
+lambda m ,line ,body :While (line ,m .group (1 ).strip (),body ))
+register_block ('kadar:',FOR_RE .pattern ,
+lambda m ,line ,body :For (line ,m .group (1 ),int (m .group (2 )),int (m .group (3 )),body ))
+register_block ('satırları:',FOR_LINES_RE .pattern ,
+lambda m ,line ,body :ForLines (line ,m .group (1 ),m .group (2 ).strip (),body ))
+register_block ('paralel:',PARALLEL_FOR_RE .pattern ,
+lambda m ,line ,body :ParallelFor (line ,m .group (1 ),int (m .group (2 )),int (m .group (3 )),body ))
+register_block ('işi:',MEMO_FUNC_DEF_RE .pattern ,
+lambda m ,line ,body :FuncDef (line ,m .group (3 ).strip (),[a .strip ()for a in split_args (m .group (2 ))],body ,
+int (m .group (1 ))if m .group (1 )else MEMO_SIZE ))
+register_block ('işi:',FUNC_DEF_RE .pattern ,
+lambda m ,line ,body :FuncDef (line ,m .group (2 ).strip (),[a .strip ()for a in split_args (m .group (1 ))],body ))
+
+def parse_statement (line ,lineno ):
+    """Turn one stripped source line into a statement node."""
+    build =SIMPLE_STATEMENTS .get (line )
+    if build is not None :
+        return build (lineno )
+    table =STATEMENT_TABLE 
+    candidates =set ()
+    for key in statement_keys (line ):
+        candidates .update (table .get (key ,()))
+    for _ ,pattern ,build in sorted (candidates ,key =lambda entry :entry [0 ]):
+        m =pattern .match (line )
+        if m :
+            return build (m ,lineno )
+    return Unknown (lineno ,line )
+
+def parse_compound (lines ,idx ,line ,ends ):
+    """Parse a block statement starting at lines[idx]. Returns (node, index after its 'bitir')."""
+    lineno =idx +1 
+    if ELSE_RE .match (line ):
+    # 'yoksa' without a preceding 'ise:' clause
+        return Unknown (lineno ,line ),idx +1 
+
+        # If-Else chain: collect the clauses up to the shared 'bitir'
+    if line .endswith (" ise:"):
+        clauses ,else_body ,ptr =[],None ,idx 
+        while True :
+            cond =IF_RE .match (lines [ptr ].strip ()).group (1 ).strip ()
+            end =ends [ptr ]
+            clauses .append ((cond ,parse_block (lines ,ptr +1 ,end ,ends )))
+            ptr =end 
+            tail =lines [ptr ].strip ()if ptr <len (lines )else "bitir"
+            if tail =="yoksa:":
+                end =ends [ptr ]
+                else_body =parse_block (lines ,ptr +1 ,end ,ends )
+                ptr =end 
+                break 
+            if tail =="bitir":
+                break 
+        return If (lineno ,clauses ,else_body ),ptr +1 
+
+    end =ends [idx ]
+    for pattern ,build in BLOCK_STATEMENTS .get (line .rsplit (None ,1 )[-1 ],()):
+        m =pattern .match (line )
+        if m :
+            return build (m ,lineno ,parse_block (lines ,idx +1 ,end ,ends )),end +1 
+            # unknown block opener: report it when reached and skip its body
+    return Unknown (lineno ,line ),end +1 
+
+def parse_block (lines ,start ,end ,ends ):
+    """Parse lines[start:end] into a list of statement nodes."""
+    nodes =[]
+    idx =start 
+    while idx <end :
+        line =lines [idx ].strip ()
+
+        # skip blanks and comments
+        if not line or line .startswith ("//"):
+            idx +=1 
+            continue 
+
+            # a 'bitir' without an open block ends the block, nothing after it runs
+        if line =="bitir":
+            break 
+
+        if line .endswith (':'):
+            node ,idx =parse_compound (lines ,idx ,line ,ends )
+        else :
+            node ,idx =parse_statement (line ,idx +1 ),idx +1 
+        nodes .append (node )
+    return nodes 
+
+def parse_program (lines ):
+    return parse_block (lines ,0 ,len (lines ),block_ends (lines ))
+
+    # --- Statement execution ---
+def exec_clear (node ):
+# Cross-platform clear
+    flush_output ()
+    try :
+        if os .name =='nt':
+            os .system ('cls')
+        else :
+            os .system ('clear')
+    except Exception :
+    # fallback: lots of newlines
+        print ("\n"*80 )
+
+def exec_new_line (node ):
+    print ()
+
+def exec_sleep (node ):
+    flush_output ()
+    try :
+        time .sleep (node .seconds )
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] Bekleme hatası: {ex}")
+
+def exec_list_create (node ):
+    set_var (node .var ,[evaluate (e )for e in node .elements ])
+
+def exec_list_get (node ):
+    list_var =get_var (node .list_name )
+    if not isinstance (list_var ,list ):
+        print (f"[Hata satır {node.line}] {node.list_name} bir liste değil")
+    elif node .index <0 or node .index >=len (list_var ):
+        print (f"[Hata satır {node.line}] Geçersiz indeks: {node.index}")
+    else :
+        set_var (node .var ,list_var [node .index ])
+
+def exec_list_set (node ):
+    new_value =evaluate (node .expr )
+    list_var =get_var (node .list_name )
+    if not isinstance (list_var ,list ):
+        print (f"[Hata satır {node.line}] {node.list_name} bir liste değil")
+    elif node .index <0 or node .index >=len (list_var ):
+        print (f"[Hata satır {node.line}] Geçersiz indeks: {node.index}")
+    else :
+        list_var [node .index ]=new_value 
+        set_var (node .list_name ,list_var )
+
+def exec_list_append (node ):
+    element =evaluate (node .expr )
+    list_var =get_var (node .list_name )
+    if not isinstance (list_var ,(list ,TextBuilder )):
+        print (f"[Hata satır {node.line}] {node.list_name} bir liste değil")
+    else :
+        list_var .append (element )
+        set_var (node .list_name ,list_var )
+
+def exec_list_remove (node ):
+    list_var =get_var (node .list_name )
+    if not isinstance (list_var ,list ):
+        print (f"[Hata satır {node.line}] {node.list_name} bir liste değil")
+    elif node .index <0 or node .index >=len (list_var ):
+        print (f"[Hata satır {node.line}] Geçersiz indeks: {node.index}")
+    else :
+        list_var .pop (node .index )
+        set_var (node .list_name ,list_var )
+
+def exec_text_op (node ):
+    text_var =get_var (node .var ,"")
+    set_var (node .target ,node .op (text_var ))
+
+def exec_file_read (node ):
+    try :
+        set_var (node .var ,builtin_dosya_oku (node .path ))
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] {ex}")
+
+def exec_file_write (node ):
+    try :
+        builtin_dosya_yaz (node .path ,evaluate (node .expr ))
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] {ex}")
+
+def exec_dir_list (node ):
+    try :
+        dosyalar =builtin_klasör_listesi ()
+        set_var (node .var ,dosyalar )
+        print_lines (["Klasördeki dosyalar:"]+[f"  - {dosya}"for dosya in dosyalar ])
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] {ex}")
+
+def exec_set_builtin (node ):
+    set_var (node .var ,node .func ())
+
+def exec_random_range (node ):
+    set_var (node .var ,builtin_rastgele (node .low ,node .high ))
+
+def exec_color_print (node ):
+    try :
+        node .func (evaluate (node .expr ))
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] {node.label}: {ex}")
+
+def exec_animation_stop (node ):
+    builtin_animasyon_durdur ()
+
+def exec_draw (node ):
+    try :
+        node .func (*node .args )
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] {node.label}: {ex}")
+
+def exec_graph (node ):
+    try :
+        builtin_grafik_çiz ([evaluate (v )for v in node .elements ])
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] Grafik çizme hatası: {ex}")
+
+def exec_dict_create (node ):
+    try :
+        set_var (node .var ,builtin_sözlük_oluştur (*node .pairs ))
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] Sözlük oluşturma hatası: {ex}")
+
+def exec_dict_get (node ):
+    try :
+        dict_var =get_var (node .dict_name )
+        if not isinstance (dict_var ,dict ):
+            print (f"[Hata satır {node.line}] {node.dict_name} bir sözlük değil")
+        else :
+            set_var (node .var ,builtin_sözlük_eleman (dict_var ,node .key ))
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] Sözlük erişim hatası: {ex}")
+
+def exec_dict_set (node ):
+    try :
+        new_value =evaluate (node .expr )
+        dict_var =get_var (node .dict_name )
+        if not isinstance (dict_var ,dict ):
+            print (f"[Hata satır {node.line}] {node.dict_name} bir sözlük değil")
+        else :
+            builtin_sözlük_ekle (dict_var ,node .key ,new_value )
+            set_var (node .dict_name ,dict_var )
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] Sözlük değiştirme hatası: {ex}")
+
+def exec_break (node ):
+    return BREAK 
+
+def exec_continue (node ):
+    return CONTINUE 
+
+def exec_return (node ):
+    return return_value (None if node .expr is None else evaluate (node .expr ))
+
+def return_value (value ):
+# end the running call with value
+    frame =env [-1 ]
+    if frame .__class__ is not Frame :
+        raise ReturnFunction (value )
+    frame .result =value 
+    return RETURN 
+
+def exec_assign (node ):
+    set_var (node .var ,evaluate (node .expr ))
+
+def exec_input (node ):
+    flush_output ()
+    set_var (node .var ,parse_input_value (input ()))
+
+def exec_print (node ):
+    try :
+        print (evaluate (node .expr ))
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] Yazdırma hatası: {ex}")
+
+def exec_call (node ):
+    try :
+        evaluate (node .expr )
+    except Exception as ex :
+        print (f"[Hata satır {node.line}] {ex}")
+
+def exec_func_def (node ):
+    functions [node .name ]=node .function 
+
+def exec_unknown (node ):
+    print (f"[Hata satır {node.line}] Tanınmayan komut: {node.text}")
+
+def exec_accumulate (node ):
+    value =evaluate (node .expr )
+    current =get_var (node .var )
+    if node .kind =='liste':
+        if current is None :
+            set_var (node .var ,[value ])
+        elif not isinstance (current ,list ):
+            print (f"[Hata satır {node.line}] {node.var} bir liste değil")
+        else :
+            current .append (value )
+    else :
+        set_var (node .var ,value if current is None else kv_add (current ,value ))
+
+        # --- Parallel loops ---
+        # 'i için X den Y kadar paralel:' splits its range into chunks that worker
+        # processes run. Each worker gets the loop, the function table and a copy of
+        # the variables, runs its chunk with the 'toplamına'/'listesine' variables
+        # starting out empty, and sends back their values and its output; those are
+        # combined in iteration order, so the results and output match the plain
+        # loop. Anything else the body changes stays in the worker.
+process_pool =None # ProcessPoolExecutor, started by the first parallel loop
+
+def init_parallel_worker ():
+# a forked worker starts with a copy of the parent's output buffer; don't write it twice
+    global file_handles 
+    sys .stdout =sys .__stdout__ 
+    # nor its writer thread: the workers write their files themselves
+    file_handles =FileHandles (FILE_HANDLES )
+
+def run_parallel_chunk (payload ,low ,high ):
+    """Worker side of exec_parallel_for(): run iterations low..high. Returns
+    (output, {variable: partial result}, None or (error message, line))."""
+    global MAX_CALL_DEPTH 
+    node ,variables ,table ,MAX_CALL_DEPTH =pickle .loads (payload )
+    del env [1 :]
+    env [0 ].clear ()
+    env [0 ].update (variables )
+    env [0 ]['__builtins__']=eval_builtins 
+    functions .clear ()
+    functions .update (table )
+    call_trace [:]=[{'name':'<paralel>','line':node .line }]
+    for name ,kind in node .results :
+        env [0 ][name ]=None 
+    out ,stdout =io .StringIO (),sys .stdout 
+    sys .stdout =out 
+    error =None 
+    try :
+        for n in range (low ,high +1 ):
+            env [0 ][node .var ]=n 
+            status =run_block (node .body )
+            if status ==BREAK or status ==RETURN :
+                raise RuntimeError ("paralel döngüde 'kır' ve 'dön' kullanılamaz")
+    except Exception as ex :
+        error =(str (ex ),call_trace [-1 ]['line'])
+    finally :
+        failures =file_handles .close_all ()
+        sys .stdout =stdout 
+    if failures and error is None :
+        error =(failures [0 ],call_trace [-1 ]['line'])
+    return out .getvalue (),{name :env [0 ][name ]for name ,kind in node .results },error 
+
+def exec_parallel_for (node ):
+    global process_pool 
+    if node .low >node .high :
+        return None 
+        # the workers see the function's variables as globals
+    variables ={name :value for name ,value in env [0 ].items ()if name !='__builtins__'}
+    if env [-1 ].__class__ is Frame :
+        variables .update (frame_locals (env [-1 ]))
+    for name ,kind in node .results :
+        variables .pop (name ,None )
+    try :
+        payload =pickle .dumps ((node ,variables ,functions ,MAX_CALL_DEPTH ),pickle .HIGHEST_PROTOCOL )
+    except Exception as ex :
+        print (f"Not: paralel döngü sırayla çalıştırılıyor ({ex}).",file =sys .stderr )
+        return run_block ([node .serial ])
+
+        # the workers run the module's own functions: an Interpreter's copies
+        # (see interpreter_globals()) can't be pickled by name
+    module =sys .modules [__name__ ]
+    if process_pool is None :
+        from concurrent .futures import ProcessPoolExecutor 
+        process_pool =ProcessPoolExecutor (initializer =module .init_parallel_worker )
+        # a few chunks per worker, so an uneven body still keeps every core busy
+    count =node .high -node .low +1 
+    chunks =min (count ,4 *(os .cpu_count ()or 1 ))
+    bounds =[node .low +count *k //chunks for k in range (chunks +1 )]
+    flush_output ()
+    failures =file_handles .close_all ()# the workers append to the same files
+    if failures :
+        raise RuntimeError (failures [0 ])
+    futures =[process_pool .submit (module .run_parallel_chunk ,payload ,bounds [k ],bounds [k +1 ]-1 )for k in range (chunks )]
+
+    partials =[]
+    for future in futures :
+        text ,results ,error =future .result ()
+        print (text ,end ='')
+        if error is not None :
+            for other in futures :
+                other .cancel ()
+            call_trace [-1 ]['line']=error [1 ]
+            raise RuntimeError (error [0 ])
+        partials .append (results )
+    for name ,kind in node .results :
+        current =get_var (name )
+        for results in partials :
+            value =results [name ]
+            if kind =='liste':
+                if value :
+                    if current is None :
+                        current =[]
+                    elif not isinstance (current ,list ):
+                        raise RuntimeError (f"{name} bir liste değil")
+                    current .extend (value )
+            elif value is not None :
+                current =value if current is None else kv_add (current ,value )
+        set_var (name ,current )
+    set_var (node .var ,node .high )
+    return None 
+
+STATEMENT_HANDLERS ={
+Clear :exec_clear ,
+NewLine :exec_new_line ,
+Sleep :exec_sleep ,
+ListCreate :exec_list_create ,
+ListGet :exec_list_get ,
+ListSet :exec_list_set ,
+ListAppend :exec_list_append ,
+ListRemove :exec_list_remove ,
+TextOp :exec_text_op ,
+FileRead :exec_file_read ,
+FileWrite :exec_file_write ,
+DirList :exec_dir_list ,
+SetBuiltin :exec_set_builtin ,
+RandomRange :exec_random_range ,
+ColorPrint :exec_color_print ,
+AnimationStop :exec_animation_stop ,
+Draw :exec_draw ,
+Graph :exec_graph ,
+DictCreate :exec_dict_create ,
+DictGet :exec_dict_get ,
+DictSet :exec_dict_set ,
+Break :exec_break ,
+Continue :exec_continue ,
+Return :exec_return ,
+Assign :exec_assign ,
+Input :exec_input ,
+Print :exec_print ,
+CallStmt :exec_call ,
+FuncDef :exec_func_def ,
+ParallelFor :exec_parallel_for ,
+Accumulate :exec_accumulate ,
+Unknown :exec_unknown ,
+}
+
+# --- Execution engine ---
+# run_block keeps nested blocks, loops and the user-function calls made by
+# 'x eşittir iş f()', 'iş f() yaz', 'iş f() dön' and 'iş f()' (with any calls in
+# their arguments) on its own stack instead of Python's, so recursion through
+# them is bounded by MAX_CALL_DEPTH rather than Python's recursion limit.
+# Calls elsewhere (conditions, list elements, ...) go through evaluate().
+
+# engine stack entries are tuples starting with their kind
+RESUME =0 # (RESUME, nodes, index): carry on with this block once the nested one ends
+LOOP =1 # (LOOP, node, iterator): loop over node.body; iterator is None for 'iken'
+# and gives the loop variable's values for 'için' and 'satırları:'
+CALL =2 # (CALL, frame, key): a user-function call running on the engine; key is its
+# memo key for a 'hafızalı' function. A result found in the memo is (CALL, None, value).
+AWAIT =3 # (AWAIT, node): a statement waiting for the value of its call
+ARGS =4 # (ARGS, call, values): a call waiting for the value of one of its arguments
+
+def run_block (nodes ):
+# Run a list of statements. Returns the status that ended it early with no
+# loop or call inside it to take it ('kır'/'devam' outside a loop, or a
+# function body's 'dön'), else None.
+    handlers =STATEMENT_HANDLERS 
+    trace =call_trace 
+    stack =[]
+    block ,i =nodes ,0 
+    start =None # call to begin, its AWAIT/ARGS entry already on the stack
+    values =None # argument values of start evaluated so far
+    status =None 
+    while True :
+        try :
+            if start is not None :
+            # evaluate the arguments left to right, starting any call among them first
+                if values is None :
+                    if start .fname not in functions :
+                        raise RuntimeError (f"Tanınmayan fonksiyon: {start.fname}")
+                    values =[]
+                args ,arg_calls =start .args ,start .arg_calls 
+                k =len (values )
+                while k <len (args )and arg_calls [k ]is None :
+                    values .append (evaluate (args [k ]))
+                    k +=1 
+                if k <len (args ):
+                    stack .append ((ARGS ,start ,values ))
+                    start ,values =arg_calls [k ],None 
+                    continue 
+                function =functions [start .fname ]
+                frame =new_frame (function ,values )
+                key =None 
+                if function .memo is not None :
+                    key =function .memo .key (frame .values [:len (function .params )])
+                    if key is not None :
+                        value =function .memo .lookup (key )
+                        if value is not UNSET :
+                        # a call with an empty body and a known result
+                            stack .append ((RESUME ,block ,i ))
+                            stack .append ((CALL ,None ,value ))
+                            block ,i =(),0 
+                            start =values =None 
+                            continue 
+                if stack [-1 ][0 ]==AWAIT and stack [-1 ][1 ].__class__ is Return :
+                # tail call ('iş f() dön'): the new call replaces the running one,
+                # whose value it is, so tail recursion runs in constant space
+                    k =len (stack )-2 
+                    while k >=0 and stack [k ][0 ]in (RESUME ,LOOP ):
+                        k -=1 
+                    if k >=0 and stack [k ][0 ]==CALL and stack [k ][2 ]is None :
+                        del stack [k :]
+                        pop_frame ()
+                    else :
+                    # the running call isn't on this stack (or there is none), or its
+                    # result goes to a memo: call as usual
+                        stack .append ((RESUME ,block ,i ))
+                else :
+                    stack .append ((RESUME ,block ,i ))
+                push_frame (frame ,name =start .fname )
+                stack .append ((CALL ,frame ,key ))
+                block ,i =function .body ,0 
+                start =values =None 
+
+            while True :
+                if i ==len (block ):
+                # next pass of an 'için' loop without leaving this loop (other block ends below)
+                    if stack :
+                        entry =stack [-1 ]
+                        if entry [0 ]==LOOP and entry [2 ]is not None :
+                            n =next (entry [2 ],None )
+                            if n is not None :
+                                set_var (entry [1 ].var ,n )
+                                i =0 
+                                continue 
+                    break 
+                node =block [i ]
+                i +=1 
+                if trace :
+                    trace [-1 ]['line']=node .line 
+                cls =node .__class__ 
+                if node .call is not None :
+                    stack .append ((AWAIT ,node ))
+                    start =node .call 
+                    break 
+                handler =handlers .get (cls )
+                if handler is not None :
+                    status =handler (node )
+                    if status :
+                        break 
+                elif cls is If :
+                # the first clause whose condition holds, else the 'yoksa:' body
+                    for cond ,body in node .clauses :
+                        if evaluate (cond ):
+                            break 
+                    else :
+                        body =node .else_body 
+                    if body :
+                        stack .append ((RESUME ,block ,i ))
+                        block ,i =body ,0 
+                elif cls is For or cls is ForLines :
+                    if cls is For :
+                        it =iter (range (node .low ,node .high +1 ))
+                    else :
+                        it =file_lines (evaluate (node .path ))
+                    n =next (it ,None )
+                    if n is not None :
+                        set_var (node .var ,n )
+                        stack .append ((RESUME ,block ,i ))
+                        stack .append ((LOOP ,node ,it ))
+                        block ,i =node .body ,0 
+                elif cls is While :
+                    if evaluate (node .cond ):
+                        stack .append ((RESUME ,block ,i ))
+                        stack .append ((LOOP ,node ,None ))
+                        block ,i =node .body ,0 
+            if start is not None :
+                continue 
+
+            if not status :
+            # the current block ended
+                if not stack :
+                    return None 
+                entry =stack [-1 ]
+                kind =entry [0 ]
+                if kind ==LOOP :
+                    node ,it =entry [1 ],entry [2 ]
+                    if it is None :
+                    # the condition is back on the loop's line (this also lets a
+                    # DeadlineTrace stop an 'iken' loop whose body has no statements)
+                        if trace :
+                            trace [-1 ]['line']=node .line 
+                        if evaluate (node .cond ):
+                            i =0 
+                            continue 
+                    else :
+                        n =next (it ,None )
+                        if n is not None :
+                            set_var (node .var ,n )
+                            i =0 
+                            continue 
+                    stack .pop ()
+                    _ ,block ,i =stack .pop ()
+                    continue 
+                if kind ==RESUME :
+                    stack .pop ()
+                    _ ,block ,i =entry 
+                    continue 
+                    # a function body ended without 'dön'
+                status =RETURN 
+
+                # hand the status up to the loop or call it belongs to
+            while status :
+                if not stack :
+                    return status 
+                entry =stack .pop ()
+                kind =entry [0 ]
+                if kind ==RESUME :
+                    _ ,block ,i =entry 
+                elif kind ==LOOP :
+                    if status ==CONTINUE :
+                    # carry on as if the body had ended
+                        stack .append (entry )
+                        block =entry [1 ].body 
+                        i =len (block )
+                        status =None 
+                    elif status ==BREAK :
+                        _ ,block ,i =stack .pop ()
+                        status =None 
+                elif kind ==CALL :
+                    frame =entry [1 ]
+                    if frame is None :
+                        value =entry [2 ]
+                    else :
+                        pop_frame ()
+                        raise_status (status )# 'kır'/'devam' that left their function
+                        value =frame .result 
+                        if entry [2 ]is not None :
+                            frame .function .memo .store (entry [2 ],value )
+                    _ ,block ,i =stack .pop ()
+                    status =None 
+                    entry =stack .pop ()
+                    if entry [0 ]==ARGS :
+                        start ,values =entry [1 ],entry [2 ]
+                        values .append (value )
+                        break 
+                    node =entry [1 ]
+                    cls =node .__class__ 
+                    if cls is Assign :
+                        set_var (node .var ,value )
+                    elif cls is Print :
+                        print (value )
+                    elif cls is Return :
+                        status =return_value (value )
+                        # CallStmt drops the value
+
+        except Exception as ex :
+        # leave the calls in between, up to the innermost statement that reports errors itself
+            start =values =status =None 
+            while stack :
+                entry =stack .pop ()
+                kind =entry [0 ]
+                if kind ==CALL :
+                    if entry [1 ]is not None :
+                        pop_frame ()
+                elif kind ==RESUME :
+                    _ ,block ,i =entry 
+                elif kind ==AWAIT and entry [1 ].__class__ is Print :
+                    report_error (entry [1 ].line ,"Yazdırma hatası: ",ex )
+                    break 
+                elif kind ==AWAIT and entry [1 ].__class__ is CallStmt :
+                    report_error (entry [1 ].line ,"",ex )
+                    break 
+            else :
+                raise 
+
+def raise_status (status ):
+# a 'kır'/'devam' that left its function (or the program) without meeting a loop
+    if status ==BREAK :
+        raise BreakLoop ()
+    if status ==CONTINUE :
+        raise ContinueLoop ()
+
+
+        # --- Compile backend (--derle) ---
+        # Translates the statement tree into Python source so CPython runs the program
+        # directly: 'işi' definitions become Python functions, 'için'/'iken' native
+        # loops, and expressions are inlined with the same kv_add semantics. Error
+        # messages match the interpreter's, because every statement keeps its try/except.
+class CompileUnsupported (Exception ):pass # program uses something --derle can't translate
+
+def is_name (s ):
+    return s .isidentifier ()and not keyword .iskeyword (s )
+
+def compiled_function_name (fname ):
+    if not is_name (fname ):
+        raise CompileUnsupported (f"fonksiyon adı: {fname}")
+    return '_kvf_'+fname 
+
+    # A compiled program nests its calls on Python's stack, so running out of
+    # it (see run_compiled()) is the --derinlik limit being reached
+def expr_error (expr ,ex ):
+    if isinstance (ex ,RecursionError ):
+        ex =depth_error ()
+    return RuntimeError (f"İfade değerlendirme hatası [{expr}]: {ex}")
+
+def report_error (line ,label ,ex ):
+    if isinstance (ex ,RecursionError ):
+        ex =depth_error ()
+    print (f"[Hata satır {line}] {label}{ex}")
+
+def undefined_function (fname ):
+    def call (*args ):
+        raise RuntimeError (f"Tanınmayan fonksiyon: {fname}")
+    return call 
+
+def memoized (compiled ,function ):
+# a 'hafızalı' function's compiled code, answering from function.memo like call_function
+    memo ,n =function .memo ,len (function .params )
+    functions [function .name ]=function # for hafıza_bilgisi()
+    def call (*args ):
+        key =memo .key ((args +(None ,)*n )[:n ])
+        if key is not None :
+            value =memo .lookup (key )
+            if value is not UNSET :
+                return value 
+        value =compiled (*args )
+        if key is not None :
+            memo .store (key ,value )
+        return value 
+    return call 
+
+class UnsetReads (ast .NodeTransformer ):
+# reads of a compiled function's locals that may come before the local is
+# assigned fall back to the global, like kv_global() for slot reads
+    def __init__ (self ,names ):
+        self .names =names 
+
+    def visit_Name (self ,node ):
+        if node .id not in self .names or not isinstance (node .ctx ,ast .Load ):
+            return node 
+        read =ast .parse (f"({node.id} if {node.id} is not _kv_unset else _kv_global({node.id!r}))",mode ='eval').body 
+        return ast .copy_location (read ,node )
+
+class PythonGenerator :
+    def __init__ (self ):
+        self .out =[]# generated source lines
+        self .line_map =[]# Kavun source line of each generated line
+        self .indent =0 
+        self .line =0 # Kavun line of the statement being generated
+        self .loops =0 # loop depth inside the current function
+        self .in_function =False 
+        self .declared =set ()# names the current Python function declares global
+        self .unset =set ()# locals of the current function that start out as _kv_unset
+        self .nodes =[]# nodes run through their interpreter handler
+        self .called =set ()
+        self .tmp =0 
+        self .sites =0 # '+' sites, each _kv_add_<n> in compiled_namespace()
+
+    def emit (self ,text ):
+        self .out .append ('    '*self .indent +text )
+        self .line_map .append (self .line )
+
+    def generate (self ,program ):
+    # top-level code runs inside _kv_main() with its variables declared
+    # global, so Kavun globals use LOAD_GLOBAL/STORE_GLOBAL instead of name lookups
+        self .indent =1 
+        self .block (program )
+        body ,body_map =self .out ,self .line_map 
+        self .out ,self .line_map ,self .line ,self .indent =[],[],0 ,0 
+        # calling a function that was never defined fails like the interpreter does
+        for fname in sorted (self .called ):
+            self .emit (f"{compiled_function_name(fname)} = _kv_undefined({fname!r})")
+        self .emit ('def _kv_main():')
+        if self .declared :
+            self .emit (f"    global {', '.join(sorted(self.declared))}")
+        self .out +=body 
+        self .line_map +=body_map 
+        self .emit ('_kv_main()')
+        return '\n'.join (self .out )+'\n'
+
+    def block (self ,nodes ):
+        if not nodes :
+            self .emit ('pass')
+        for node in nodes :
+            self .line =node .line 
+            gen =getattr (self ,'gen_'+node .__class__ .__name__ ,None )
+            if gen is None :
+                raise CompileUnsupported (node .__class__ .__name__ )
+            gen (node )
+
+    def new_tmp (self ):
+        self .tmp +=1 
+        return f"_kv_t{self.tmp}"
+
+    def name (self ,s ):
+        if not is_name (s ):
+            raise CompileUnsupported (f"değişken adı: {s}")
+        if not self .in_function :
+            self .declared .add (s )
+        return s 
+
+    def front (self ,expr ):
+        try :
+            tree ,call =parse_expr (expr )
+        except RuntimeError as ex :
+        # invalid expressions fail when reached, not at compile time
+            self .emit (f"raise RuntimeError({str(ex)!r})")
+            return None ,None 
+        if call is not None :
+            return None ,call 
+        for node in ast .walk (tree ):
+            if isinstance (node ,ast .Call )and is_add_site (node .func ):
+                self .sites +=1 
+                node .func =ast .Name (f"_kv_add_{self.sites}",ast .Load ())
+        if self .in_function and self .unset :
+            tree =UnsetReads (self .unset ).visit (tree )
+        return ast .unparse (tree .body ),None 
+
+    def checked (self ,stmt ,expr ):
+    # run stmt, reporting a failure the way evaluate() does
+        self .emit ('try:')
+        self .indent +=1 
+        self .emit (stmt )
+        self .indent -=1 
+        self .emit ('except Exception as _kv_e:')
+        self .indent +=1 
+        self .emit (f"raise _kv_expr_error({expr!r}, _kv_e) from None")
+        self .indent -=1 
+
+    def call (self ,call ):
+        fname ,arg_exprs =call 
+        self .called .add (fname )
+        args =[self .value (a )for a in arg_exprs ]
+        return f"{compiled_function_name(fname)}({', '.join(args)})"
+
+    def value (self ,expr ):
+        """Emit whatever evaluating expr needs and return a Python expression for its value."""
+        src ,call =self .front (expr )
+        if call is not None :
+            return self .call (call )
+        if src is None :
+            return 'None'
+        t =self .new_tmp ()
+        self .checked (f"{t} = {src}",expr )
+        return t 
+
+    def assign (self ,target ,expr ):
+        src ,call =self .front (expr )
+        if call is not None :
+            self .emit (f"{target} = {self.call(call)}")
+        elif src is not None :
+            self .checked (f"{target} = {src}",expr )
+
+    def reported (self ,label ,build ):
+    # statements that print '[Hata satır N] ...' and carry on
+        self .emit ('try:')
+        self .indent +=1 
+        build ()
+        self .indent -=1 
+        self .emit ('except Exception as _kv_e:')
+        self .indent +=1 
+        self .emit (f"_kv_report({self.line}, {label!r}, _kv_e)")
+        self .indent -=1 
+
+    def lookup (self ,name ,default =None ):
+    # a missing name reads as default, like get_var()
+        t =self .new_tmp ()
+        if self .in_function and name in self .unset :
+            self .emit (f"{t} = {name}")
+            self .emit (f"if {t} is _kv_unset:")
+            self .emit (f"    {t} = _kv_global({name!r}, {default!r})")
+            return t 
+        self .emit ('try:')
+        self .emit (f"    {t} = {self.name(name)}")
+        self .emit ('except NameError:')
+        self .emit (f"    {t} = {default!r}")
+        return t 
+
+    def run_node (self ,node ):
+        self .nodes .append (node )
+        self .emit (f"_kv_run(_kv_nodes[{len(self.nodes) - 1}])")
+
+        # statements that don't touch variables reuse the interpreter's handler
+    gen_Clear =gen_NewLine =gen_Sleep =gen_AnimationStop =gen_Draw =gen_Unknown =run_node 
+
+    def gen_ListCreate (self ,node ):
+        values =[self .value (e )for e in node .elements ]
+        self .emit (f"{self.name(node.var)} = [{', '.join(values)}]")
+
+    def check_list (self ,t ,node ,index =True ):
+    # '.ekle' (the only use without an index) also appends to a metin_oluşturucu()
+        self .emit (f"if not isinstance({t}, {'list' if index else '(list, _kv_TextBuilder)'}):")
+        self .emit (f"    _kv_print({f'[Hata satır {node.line}] {node.list_name} bir liste değil'!r})")
+        if index :
+            self .emit (f"elif {node.index} >= len({t}):")
+            self .emit (f"    _kv_print({f'[Hata satır {node.line}] Geçersiz indeks: {node.index}'!r})")
+        self .emit ('else:')
+
+    def gen_ListGet (self ,node ):
+        t =self .lookup (node .list_name )
+        self .check_list (t ,node )
+        self .emit (f"    {self.name(node.var)} = {t}[{node.index}]")
+
+    def gen_ListSet (self ,node ):
+        v =self .value (node .expr )
+        t =self .lookup (node .list_name )
+        self .check_list (t ,node )
+        self .emit (f"    {t}[{node.index}] = {v}")
+
+    def gen_ListAppend (self ,node ):
+        v =self .value (node .expr )
+        t =self .lookup (node .list_name )
+        self .check_list (t ,node ,index =False )
+        self .emit (f"    {t}.append({v})")
+
+    def gen_ListRemove (self ,node ):
+        t =self .lookup (node .list_name )
+        self .check_list (t ,node )
+        self .emit (f"    {t}.pop({node.index})")
+
+    def gen_TextOp (self ,node ):
+        t =self .lookup (node .var ,"")
+        self .emit (f"{self.name(node.target)} = _kv_{node.op.__name__}({t})")
+
+    def gen_FileRead (self ,node ):
+        self .reported ('',lambda :self .emit (f"{self.name('dosya_içerik')} = _kv_builtin_dosya_oku({node.path!r})"))
+
+    def gen_FileWrite (self ,node ):
+        def build ():
+            v =self .value (node .expr )
+            self .emit (f"_kv_builtin_dosya_yaz({node.path!r}, {v})")
+        self .reported ('',build )
+
+    def gen_DirList (self ,node ):
+        def build ():
+            t =self .new_tmp ()
+            self .emit (f"{t} = _kv_builtin_klasör_listesi()")
+            self .emit (f"{self.name('dosya_listesi')} = {t}")
+            self .emit ("_kv_print('Klasördeki dosyalar:')")
+            self .emit (f"for _kv_d in {t}:")
+            self .emit ("    _kv_print(f'  - {_kv_d}')")
+        self .reported ('',build )
+
+    def gen_SetBuiltin (self ,node ):
+        self .emit (f"{self.name(node.var)} = _kv_{node.func.__name__}()")
+
+    def gen_RandomRange (self ,node ):
+        self .emit (f"{self.name(node.var)} = _kv_builtin_rastgele({node.low}, {node.high})")
+
+    def gen_ColorPrint (self ,node ):
+        def build ():
+            v =self .value (node .expr )
+            self .emit (f"_kv_{node.func.__name__}({v})")
+        self .reported (node .label +': ',build )
+
+    def gen_Graph (self ,node ):
+        def build ():
+            values =[self .value (v )for v in node .elements ]
+            self .emit (f"_kv_builtin_grafik_çiz([{', '.join(values)}])")
+        self .reported ('Grafik çizme hatası: ',build )
+
+    def gen_DictCreate (self ,node ):
+        self .reported ('Sözlük oluşturma hatası: ',
+        lambda :self .emit (f"{self.name(node.var)} = _kv_builtin_sözlük_oluştur(*{node.pairs!r})"))
+
+    def check_dict (self ,t ,node ):
+        self .emit (f"if not isinstance({t}, dict):")
+        self .emit (f"    _kv_print({f'[Hata satır {node.line}] {node.dict_name} bir sözlük değil'!r})")
+        self .emit ('else:')
+
+    def gen_DictGet (self ,node ):
+        def build ():
+            t =self .lookup (node .dict_name )
+            self .check_dict (t ,node )
+            self .emit (f"    {self.name(node.var)} = _kv_builtin_sözlük_eleman({t}, {node.key!r})")
+        self .reported ('Sözlük erişim hatası: ',build )
+
+    def gen_DictSet (self ,node ):
+        def build ():
+            v =self .value (node .expr )
+            t =self .lookup (node .dict_name )
+            self .check_dict (t ,node )
+            self .emit (f"    _kv_builtin_sözlük_ekle({t}, {node.key!r}, {v})")
+        self .reported ('Sözlük değiştirme hatası: ',build )
+
+    def gen_Break (self ,node ):
+        self .emit ('break'if self .loops else 'raise _kv_BreakLoop()')
+
+    def gen_Continue (self ,node ):
+        self .emit ('continue'if self .loops else 'raise _kv_ContinueLoop()')
+
+    def gen_Return (self ,node ):
+        if not self .in_function :
+            v ='None'if node .expr is None else self .value (node .expr )
+            self .emit (f"raise _kv_ReturnFunction({v})")
+        elif node .expr is None :
+            self .emit ('return None')
+        else :
+            src ,call =self .front (node .expr )
+            if call is not None :
+                self .emit (f"return {self.call(call)}")
+            elif src is not None :
+                self .checked (f"return {src}",node .expr )
+
+    def gen_Assign (self ,node ):
+        self .assign (self .name (node .var ),node .expr )
+
+    def gen_Input (self ,node ):
+        self .emit (f"{self.name(node.var)} = _kv_parse_input_value(_kv_input())")
+
+    def gen_Print (self ,node ):
+        self .reported ('Yazdırma hatası: ',lambda :self .emit (f"_kv_print({self.value(node.expr)})"))
+
+    def gen_CallStmt (self ,node ):
+        self .reported ('',lambda :self .emit (self .value (node .expr )))
+
+    def gen_If (self ,node ):
+        self .if_chain (node ,node .clauses )
+
+    def if_chain (self ,node ,clauses ):
+        self .line =node .line 
+        cond ,body =clauses [0 ]
+        self .emit (f"if {self.value(cond)}:")
+        self .indent +=1 
+        self .block (body )
+        self .indent -=1 
+        if len (clauses )>1 or node .else_body is not None :
+            self .emit ('else:')
+            self .indent +=1 
+            if len (clauses )>1 :
+                self .if_chain (node ,clauses [1 :])
+            else :
+                self .block (node .else_body )
+            self .indent -=1 
+
+    def loop_body (self ,body ):
+        self .loops +=1 
+        self .block (body )
+        self .loops -=1 
+
+    def gen_While (self ,node ):
+        self .emit ('while True:')
+        self .indent +=1 
+        self .emit (f"if not {self.value(node.cond)}:")
+        self .emit ('    break')
+        self .loop_body (node .body )
+        self .indent -=1 
+
+    def gen_For (self ,node ):
+        self .emit (f"for {self.name(node.var)} in range({node.low}, {node.high + 1}):")
+        self .indent +=1 
+        self .loop_body (node .body )
+        self .indent -=1 
+
+    def gen_ForLines (self ,node ):
+        self .emit (f"for {self.name(node.var)} in _kv_file_lines({self.value(node.path)}):")
+        self .indent +=1 
+        self .loop_body (node .body )
+        self .indent -=1 
+
+    def gen_FuncDef (self ,node ):
+        fname =compiled_function_name (node .name )
+        params =[self .name (p )for p in node .params ]
+        if len (set (params ))!=len (params ):
+            raise CompileUnsupported (f"tekrarlanan parametre: {node.name}")
+            # Kavun functions are global wherever they are defined
+        self .declared .add (fname )
+
+        # the other locals hold _kv_unset until assigned (a keyword default, so reading it is a local load)
+        unset =sorted (set (node .function .slots )-set (params ))
+        outer =(self .out ,self .line_map ,self .indent ,self .loops ,self .in_function ,self .declared ,self .unset )
+        self .out ,self .line_map ,self .indent ,self .loops ,self .in_function ,self .declared ,self .unset =[],[],self .indent +1 ,0 ,True ,set (),set (unset )
+        self .block (node .body )
+        body ,body_map ,declared =self .out ,self .line_map ,self .declared 
+        self .out ,self .line_map ,self .indent ,self .loops ,self .in_function ,self .declared ,self .unset =outer 
+
+        self .line =node .line 
+        # missing arguments are None and extra ones are ignored, like call_function
+        self .emit (f"def {fname}({''.join(p + '=None, ' for p in params)}*_kv_rest, _kv_unset=_kv_unset):")
+        if declared :
+            self .emit (f"    global {', '.join(sorted(declared))}")
+        if unset :
+            self .emit (f"    {' = '.join(self.name(v) for v in unset)} = _kv_unset")
+        self .out +=body 
+        self .line_map +=body_map 
+        if node .function .memo is not None :
+            self .nodes .append (node )
+            self .emit (f"{fname} = _kv_memoized({fname}, _kv_nodes[{len(self.nodes) - 1}].function)")
+
+def compiled_namespace (nodes ,sites ):
+    ns ={'__builtins__':eval_builtins }
+
+    def read_global (name ,*default ):
+    # kv_global() for compiled code, whose globals are ns; with a default, get_var()
+        if name in ns :
+            return ns [name ]
+        if default :
+            return builtin_functions .get (name ,default [0 ])
+        if name in eval_builtins :
+            return eval_builtins [name ]
+        raise NameError (f"name '{name}' is not defined")
+
+    for n in range (1 ,sites +1 ):
+        ns [f"_kv_add_{n}"]=add_site ()
+    for func in builtin_functions .values ():
+        ns ['_kv_'+func .__name__ ]=func 
+    ns .update ({
+    '_kv_print':print ,
+    '_kv_input':input ,
+    '_kv_parse_input_value':parse_input_value ,
+    '_kv_report':report_error ,
+    '_kv_expr_error':expr_error ,
+    '_kv_undefined':undefined_function ,
+    '_kv_memoized':memoized ,
+    '_kv_TextBuilder':TextBuilder ,
+    '_kv_file_lines':file_lines ,
+    '_kv_unset':UNSET ,
+    '_kv_global':read_global ,
+    '_kv_run':lambda node :STATEMENT_HANDLERS [node .__class__ ](node ),
+    '_kv_nodes':nodes ,
+    '_kv_BreakLoop':BreakLoop ,
+    '_kv_ContinueLoop':ContinueLoop ,
+    '_kv_ReturnFunction':ReturnFunction ,
+    })
+    return ns 
+
+COMPILED_STACK_MARGIN =50 # Python frames a compiled call may add below the deepest one (built-ins, memo wrappers)
+
+def run_compiled (program ):
+    """Run a parsed program with the --derle backend, falling back to the interpreter if it can't be translated."""
+    gen =PythonGenerator ()
+    try :
+        code =compile (gen .generate (program ),'<kavun-derle>','exec')
+    except (CompileUnsupported ,SyntaxError )as ex :
+        print (f"Not: program derlenemedi ({ex}), yorumlayıcı ile çalıştırılıyor.",file =sys .stderr )
+        raise_status (run_block (program ))
+        return 
+        # a Kavun call is a Python call here: make room for MAX_CALL_DEPTH of them
+        # on top of the frames already running, and no more
+    frame ,depth =sys ._getframe (),0 
+    while frame is not None :
+        frame ,depth =frame .f_back ,depth +1 
+    limit =sys .getrecursionlimit ()
+    sys .setrecursionlimit (depth +MAX_CALL_DEPTH +COMPILED_STACK_MARGIN )
+    try :
+        exec (code ,compiled_namespace (gen .nodes ,gen .sites ))
+    except RecursionError :
+        raise depth_error ()from None 
+    except Exception as e :
+    # report the top-level line that was running, like the interpreter's call trace
+        tb =e .__traceback__ 
+        while tb is not None and tb .tb_frame .f_code .co_name !='_kv_main':
+            tb =tb .tb_next 
+        if tb is not None :
+            call_trace [-1 ]['line']=gen .line_map [tb .tb_lineno -1 ]
+        raise 
+    finally :
+        sys .setrecursionlimit (limit )
+
+        # Print a short runtime trace (Turkish)
+def print_runtime_error (exc ):
+    print ("Çalışma zamanı hatası:",exc )
+    if call_trace :
+        print ("Çağrı yığını (son çağrı en üstte):")
+        for frame in reversed (call_trace ):
+            name =frame .get ('name','<anon>')
+            line =frame .get ('line')
+            if line is None :
+                print (f"  - {name}")
+            else :
+                print (f"  - {name} (satır {line})")
+    print ("Hata detaylarını görmek için ortam değişkeni KAVUN_DEBUG=1 ile tekrar çalıştırın.")
+
+    # --- Program cache (.kvnc) ---
+CACHE_VERSION =2 # bump when the statement tree or the cache layout changes
+
+def interpreter_stamp ():
+# the interpreter file's modification time and size, so editing it invalidates
+# every cache; None when it runs without its source file (from a zip, say)
+    try :
+        st =os .stat (__file__ )
+    except OSError :
+        return None 
+    return st .st_mtime_ns ,st .st_size 
+
+def code_entries (entries ,convert ):
+# compile_expr()/slot_expr_code() results with convert applied to their code
+    return {key :(code if code is None else convert (code ),call )for key ,(code ,call )in entries .items ()}
+
+class ProgramCache :
+    """A script's .kvnc file: its parsed statement tree and the code objects
+    compiled for its expressions so far, keyed by the source itself and the
+    interpreter file's stamp. A run of the same source loads them instead of parsing
+    and compiling again; a missing, stale or unreadable file just means parsing.
+    It parses into and fills the caches of namespace, by default this
+    module's globals (an Interpreter's copy of them, see interpreter_globals())."""
+
+    def __init__ (self ,path ,source ,namespace =None ):
+        self .namespace =globals ()if namespace is None else namespace 
+        self .path =os .path .splitext (path )[0 ]+'.kvnc'
+        self .key =(CACHE_VERSION ,sys .implementation .cache_tag ,interpreter_stamp (),source )
+        self .tree =None # pickled statement tree, None when it can't be cached
+        self .codes =-1 # compiled expressions the file holds, -1 without a usable file
+
+    def load (self ,lines ):
+        """The program's statement tree, from the cache file if it is current."""
+        ns =self .namespace 
+        try :
+            with open (self .path ,'rb')as f :
+                key ,tree ,codes =pickle .load (f )
+            if key !=self .key :
+                raise ValueError ("eski önbellek")
+            program =pickle .loads (tree )
+            exprs ,slot_exprs =marshal .loads (codes )
+        except Exception :
+            program =ns ['parse_program'](lines )
+            try :
+                self .tree =pickle .dumps (program )
+            except Exception :
+                self .tree =None 
+            return program 
+        self .tree =tree 
+        for expr ,entry in code_entries (exprs ,with_add_sites ).items ():
+            ns ['expr_cache'].add (expr ,entry )
+        for key ,entry in code_entries (slot_exprs ,with_add_sites ).items ():
+            ns ['slot_codes'].add (key ,entry )
+        self .codes =len (exprs )+len (slot_exprs )
+        return program 
+
+    def save (self ):
+    # (re)write the file when it is missing or the run compiled expressions it lacks
+        expr_cache ,slot_codes =self .namespace ['expr_cache'],self .namespace ['slot_codes']
+        if self .tree is None or len (expr_cache )+len (slot_codes )==self .codes :
+            return 
+        temp =f"{self.path}.{os.getpid()}.tmp"
+        try :
+            codes =marshal .dumps ((code_entries (expr_cache .entries (),without_add_sites ),
+            code_entries (slot_codes .entries (),without_add_sites )))
+            with open (temp ,'wb')as f :
+                pickle .dump ((self .key ,self .tree ,codes ),f ,pickle .HIGHEST_PROTOCOL )
+            os .replace (temp ,self .path )
+        except (OSError ,ValueError ):
+            try :
+                os .remove (temp )
+            except OSError :
+                pass 
+
+
+                # --- Profiler (--profil) ---
+class Profiler :
+    """How often each source line, user function, expression evaluation and
+    built-in ran, with its cumulative time (including what it called) and
+    self time (excluding it). install() swaps push_frame, pop_frame, evaluate
+    and the built-ins for timing versions, so a run without --profil doesn't
+    pay anything for it. It profiles the program run in namespace, by default
+    this module's globals (see ProgramCache)."""
+
+    def __init__ (self ,lines ,namespace =None ):
+        self .lines =lines # source lines, for the report
+        self .namespace =globals ()if namespace is None else namespace 
+        self .stats ={}# (kind, name) -> [hits, cumulative, self]
+        self .stack =[]# open activities: [key, start, time in nested activities, time in called functions]
+        self .functions =[]# stack indices of the open user-function activities
+        self .active =collections .Counter ()# open activities per key, so recursion isn't counted twice
+
+    def enter (self ,key ):
+        stats =self .stats .get (key )
+        if stats is None :
+            stats =self .stats [key ]=[0 ,0.0 ,0.0 ]
+        stats [0 ]+=1 
+        self .active [key ]+=1 
+        if key [0 ]=='iş':
+            self .functions .append (len (self .stack ))
+        self .stack .append ([key ,time .perf_counter (),0.0 ,0.0 ])
+
+    def leave (self ):
+        key ,start ,nested ,called =self .stack .pop ()
+        elapsed =time .perf_counter ()-start 
+        stats =self .stats [key ]
+        self .active [key ]-=1 
+        if not self .active [key ]:
+            stats [1 ]+=elapsed 
+        if key [0 ]=='iş':
+        # a function's own time is what its lines took without other functions' time
+            self .functions .pop ()
+            stats [2 ]+=elapsed -called 
+            if self .functions :
+                self .stack [self .functions [-1 ]][3 ]+=elapsed 
+        else :
+            stats [2 ]+=elapsed -nested 
+        if self .stack :
+            self .stack [-1 ][2 ]+=elapsed 
+
+    def timed (self ,key ,func ):
+        def call (*args ,**kwargs ):
+            self .enter (key )
+            try :
+                return func (*args ,**kwargs )
+            finally :
+                self .leave ()
+        return call 
+
+    def install (self ):
+    # before parsing, so statements that hold a built-in get the timed one
+        g =self .namespace 
+        push ,pop ,trace =g ['push_frame'],g ['pop_frame'],g ['call_trace']
+
+        def profiled_push_frame (frame ,name =None ):
+            push (frame ,name )
+            self .enter (('iş',name or '<anon>'))
+            trace [-1 ]=ProfiledTrace (trace [-1 ],self )
+
+        def profiled_pop_frame ():
+            trace [-1 ].close ()
+            self .leave ()
+            pop ()
+
+        g ['push_frame'],g ['pop_frame']=profiled_push_frame ,profiled_pop_frame 
+        g ['evaluate']=self .timed (('ifade','evaluate'),g ['evaluate'])
+        for name ,func in g ['builtin_functions'].items ():
+            timed =self .timed (('yerleşik',name ),func )
+            g ['eval_builtins'][name ]=timed 
+            if g .get (func .__name__ )is func :
+                g [func .__name__ ]=timed 
+
+    def start (self ):
+    # time the program as the '<main>' function, from the call_trace entry main() pushed
+        trace =self .namespace ['call_trace']
+        self .enter (('iş','<main>'))
+        trace [-1 ]=ProfiledTrace (trace [-1 ],self )
+
+    def stop (self ):
+        while self .stack :
+            self .leave ()
+
+    def rows (self ):
+    # (kind, name, hits, cumulative, self), most self time first
+        rows =[]
+        for (kind ,name ),(hits ,total ,own )in self .stats .items ():
+            if kind =='satır':
+                name =f"{name}: {self.lines[name - 1].strip()[:40]}"
+            rows .append ((kind ,name ,hits ,total ,own ))
+        rows .sort (key =lambda row :row [4 ],reverse =True )
+        return rows 
+
+    def report (self ,file ):
+        rows =self .rows ()
+        print ("Profil (süreler ms; toplam: çağırdıkları dahil, kendi: hariç)",file =file )
+        print (f"{'tür':<9} {'ad':<48} {'sayı':>9} {'toplam':>10} {'kendi':>10}",file =file )
+        for kind ,name ,hits ,total ,own in rows :
+            print (f"{kind:<9} {name:<48} {hits:>9} {total * 1000:>10.2f} {own * 1000:>10.2f}",file =file )
+
+    def write_json (self ,path ):
+        rows =[{'tür':kind ,'ad':name ,'sayı':hits ,'toplam':total ,'kendi':own }
+        for kind ,name ,hits ,total ,own in self .rows ()]
+        with open (path ,'w',encoding ='utf-8')as f :
+            json .dump (rows ,f ,ensure_ascii =False ,indent =2 )
+
+class ProfiledTrace (dict ):
+# call_trace entry that tells the profiler when its frame moves on to another line
+    __slots__ =('profiler','open')
+
+    def __init__ (self ,entry ,profiler ):
+        super ().__init__ (entry )
+        self .profiler =profiler 
+        self .open =False 
+
+    def __setitem__ (self ,key ,value ):
+        dict .__setitem__ (self ,key ,value )
+        if key =='line':
+            if self .open :
+                self .profiler .leave ()
+            self .profiler .enter (('satır',value ))
+            self .open =True 
+
+    def close (self ):
+        if self .open :
+            self .profiler .leave ()
+            self .open =False 
+
+def parse_options (flags ,switches =('--derle','--önbelleksiz','--arkaplanda-yaz'),numbers =('--derinlik','--tampon'),texts =('--profil',)):
+    """'--ad' and '--ad=değer' flags as {'--ad': True or 'değer'}, or None if one
+    isn't valid: switches take no value, numbers a whole number, texts either."""
+    options ={}
+    for a in flags :
+        name ,eq ,value =a .partition ('=')
+        options [name ]=value if eq else True 
+    if set (options )-{*switches ,*numbers ,*texts }or len (options )!=len (flags ):
+        return None 
+    if any (options .get (name ,True )is not True for name in switches ):
+        return None 
+    for name in numbers :
+        if name in options :
+            if options [name ]is True or not options [name ].isdigit ():
+                return None 
+            options [name ]=int (options [name ])
+    return options 
+
+
+def run_program (program ,compiled =False ,start =None ):
+    """Run a parsed program as the '<main>' call, with the --derle backend if
+    compiled. A runtime error is reported on stdout, not raised. start() is
+    called once the '<main>' call_trace entry is in place. Writes that fail
+    only when the files are closed at the end are reported on stderr, and
+    False is returned for them."""
+    call_trace .append ({'name':'<main>','line':None })
+    if start :
+        start ()
+    try :
+        if compiled :
+            run_compiled (program )
+        else :
+            raise_status (run_block (program ))
+        file_handles .drain ()# a write that fails now is an error of the program
+    except Exception as e :
+        print_runtime_error (e )
+        if os .environ .get ('KAVUN_DEBUG')=='1':
+            flush_output ()
+            traceback .print_exc ()
+    finally :
+        failures =file_handles .close_all ()
+        call_trace .clear ()
+        if failures :
+            flush_output ()
+            for message in failures :
+                print (message ,file =sys .stderr )
+    return not failures 
+
+def cache_stats ():
+# expr_cache's and slot_codes' counters and bounds added up
+    stats =expr_cache .stats ()
+    for key ,value in slot_codes .stats ().items ():
+        stats [key ]+=value 
+    return stats 
+
+def report_cache_stats (stream ):
+# the expression caches' counters, printed at exit with KAVUN_DEBUG=1
+    for label ,cache in (("İfade önbelleği",expr_cache ),("Fonksiyon ifadeleri",slot_codes )):
+        s =cache .stats ()
+        print (f"{label}: {s['isabet']} isabet, {s['ıska']} ıska, {s['atılan']} atılan, "
+        f"{s['boyut']}/{s['sınır']} ifade, {s['bayt'] // 1024}/{s['bayt_sınırı'] // 1024} KB",file =stream )
+
+def reset_state ():
+    """Forget the variables, functions and call trace a program left behind and
+    stop its animation. The expression caches stay warm."""
+    builtin_animasyon_durdur ()
+    del env [1 :]
+    env [0 ].clear ()
+    env [0 ]['__builtins__']=eval_builtins 
+    functions .clear ()
+    call_trace .clear ()
+
+class ScriptTimeout (BaseException ):
+    """A program ran past its time limit. Not an Exception, so the error
+    reporting of statements and run_program() lets it through."""
+
+class DeadlineTrace (dict ):
+# call_trace entry that stops the program once the deadline has passed
+    __slots__ =('deadline',)
+
+    def __init__ (self ,entry ,deadline ):
+        super ().__init__ (entry )
+        self .deadline =deadline 
+
+    def __setitem__ (self ,key ,value ):
+        dict .__setitem__ (self ,key ,value )
+        if self .deadline .passed ():
+            raise ScriptTimeout ()
+
+class Deadline :
+    """Stands in for the time module while run_limited() runs, so 'bekle'
+    stops at the deadline instead of sleeping past it."""
+    __slots__ =('clock','end')
+
+    def __init__ (self ,clock ,seconds ):
+        self .clock =clock 
+        self .end =clock .monotonic ()+seconds 
+
+    def passed (self ):
+        return self .clock .monotonic ()>self .end 
+
+    def sleep (self ,seconds ):
+        left =self .end -self .clock .monotonic ()
+        if seconds >left :
+            self .clock .sleep (max (left ,0 ))
+            raise ScriptTimeout ()
+        self .clock .sleep (seconds )
+
+    def __getattr__ (self ,attr ):
+        return getattr (self .clock ,attr )
+
+def run_limited (program ,seconds ):
+    """run_program() that raises ScriptTimeout at the first statement, 'iken'
+    condition or 'bekle' after seconds have passed. push_frame and the time module are
+    swapped for checking versions only for this run."""
+    g =globals ()
+    push ,clock =push_frame ,time 
+    deadline =Deadline (clock ,seconds )
+
+    def limited_push_frame (frame ,name =None ):
+        push (frame ,name )
+        call_trace [-1 ]=DeadlineTrace (call_trace [-1 ],deadline )
+
+    def start ():
+        call_trace [-1 ]=DeadlineTrace (call_trace [-1 ],deadline )
+
+    g ['push_frame'],g ['time']=limited_push_frame ,deadline 
+    try :
+        run_program (program ,start =start )
+    finally :
+        g ['push_frame'],g ['time']=push ,clock 
+
+def rebound (value ,ns ,copies ):
+    """value with this module's functions in it, also inside dicts, lists and
+    tuples, replaced by copies whose globals are ns. copies maps the id() of
+    what was copied already to its copy, so what is shared stays shared."""
+    copy =copies .get (id (value ))
+    if copy is not None :
+        return copy 
+    cls =value .__class__ 
+    if cls is types .FunctionType and value .__globals__ is globals ():
+        copy =types .FunctionType (value .__code__ ,ns ,value .__name__ ,value .__defaults__ ,value .__closure__ )
+        copy .__kwdefaults__ =value .__kwdefaults__ 
+        copy .__qualname__ =value .__qualname__ 
+    elif cls is dict :
+        copy =copies [id (value )]={}
+        for key ,item in value .items ():
+            copy [key ]=rebound (item ,ns ,copies )
+    elif cls is list :
+        copy =copies [id (value )]=[]
+        copy .extend (rebound (item ,ns ,copies )for item in value )
+    elif cls is tuple :
+        copy =tuple (rebound (item ,ns ,copies )for item in value )
+    else :
+        return value 
+    copies [id (value )]=copy 
+    return copy 
+
+def interpreter_globals (max_depth ,write_behind ):
+    """The globals an Interpreter runs in: a copy of this module's with its
+    own runtime state, and every function rebound to the copy so that state
+    is what they see. Classes and constants stay the module's own, so objects
+    from different Interpreters are of the same classes and pickle by name."""
+    ns =dict (globals ())
+    ns .update (
+    env =[{}],
+    functions ={},
+    expr_cache =ExprCache (EXPR_CACHE_SIZE ,EXPR_CACHE_MEMORY ),
+    slot_codes =SlotExprCache (EXPR_CACHE_SIZE ,EXPR_CACHE_MEMORY ),
+    call_trace =[],
+    MAX_CALL_DEPTH =max_depth ,
+    file_handles =FileHandles (FILE_HANDLES ),
+    line_indexes ={},
+    animation_running =False ,
+    animation_thread =None ,
+    process_pool =None ,
+    )
+    copies ={}
+    for name ,value in ns .items ():
+        if name .startswith ('__'):
+            continue 
+        if value .__class__ is LazyModule :
+            ns [name ]=LazyModule (value .name ,value .setup ,ns )
+        else :
+            ns [name ]=rebound (value ,ns ,copies )
+    ns ['env'][0 ]['__builtins__']=ns ['eval_builtins']
+    if write_behind :
+        ns ['file_handles']=WriteBehind (ns ['file_handles'])
+    return ns 
+
+class Interpreter :
+    """A Kavun interpreter for embedding: it owns its variables, function table,
+    call trace and caches, so one process can run many programs, one after
+    another or in several threads at once, without them seeing each other.
+
+    The interpreter is written against module globals, so each Interpreter
+    runs in a private copy of them (interpreter_globals()) and calls the
+    copy's functions. With write_behind, its file writes go through a writer
+    thread as with --arkaplanda-yaz; each run_source() waits for them before
+    returning."""
+
+    def __init__ (self ,max_depth =MAX_CALL_DEPTH ,write_behind =False ):
+        self .state =interpreter_globals (max_depth ,write_behind )
+
+    def run_source (self ,source ,compiled =False ,timeout =None ):
+        """Run Kavun source text. Output goes to sys.stdout; a runtime error is
+        reported there like on the command line. Variables and functions stay
+        until reset(). With timeout, TimeoutError is raised at the first
+        statement or 'bekle' after that many seconds (such runs don't use --derle)."""
+        state =self .state 
+        program =state ['parse_program'](source .splitlines ())
+        if timeout is None :
+            state ['run_program'](program ,compiled )
+            return 
+        try :
+            state ['run_limited'](program ,timeout )
+        except ScriptTimeout :
+            raise TimeoutError (f"program {timeout} saniyede bitmedi")from None 
+
+    def run_file (self ,path ,compiled =False ,timeout =None ):
+        """Run a .kvn file; see run_source()."""
+        with open (path ,encoding ='utf-8')as f :
+            self .run_source (f .read (),compiled ,timeout )
+
+    def reset (self ):
+        """Start over with no variables or functions, keeping the compiled expressions."""
+        self .state ['reset_state']()
+
+    def cache_stats (self ):
+        """Hit, miss and eviction counts and the size of the expression caches,
+        top-level and function expressions together; see ExprCache.stats()."""
+        return self .state ['cache_stats']()
+
+
+class ThreadRouted :
+    """Stands in for sys.stdout, sys.stderr or sys.stdin while run_batch()
+    runs: a worker thread uses the stream of the script it is running, any
+    other thread the original one."""
+
+    def __init__ (self ,original ):
+        self .original =original 
+        self .local =threading .local ()
+
+    def current (self ):
+        stream =getattr (self .local ,'stream',None )
+        return self .original if stream is None else stream 
+
+    def write (self ,text ):
+        return self .current ().write (text )
+
+    def __getattr__ (self ,attr ):
+        return getattr (self .current (),attr )
+
+class BatchResult :
+    """One script's run in run_batch(): its output, how long it took and whether it hit the time limit."""
+    __slots__ =('path','stdout','stderr','seconds','timed_out')
+
+    def __init__ (self ,path ,stdout ,stderr ,seconds ,timed_out ):
+        self .path =path 
+        self .stdout =stdout 
+        self .stderr =stderr 
+        self .seconds =seconds 
+        self .timed_out =timed_out 
+
+def run_batch (paths ,workers =4 ,timeout =None ,inputs =None ):
+    """Run many .kvn files at once on a pool of worker threads; returns a
+    BatchResult per path, in order. Each thread runs its scripts one after
+    another on an Interpreter of its own, reset in between so compiled
+    expressions carry over. inputs maps a path to the text its cevap() calls
+    read; timeout is a limit in seconds per script. Scripts that wait
+    ('bekle', files) overlap; CPU-bound ones still take turns on the GIL."""
+    from concurrent .futures import ThreadPoolExecutor 
+    inputs =inputs or {}
+    local =threading .local ()
+    streams =[ThreadRouted (stream )for stream in (sys .stdout ,sys .stderr ,sys .stdin )]
+
+    def run (path ):
+        interpreter =getattr (local ,'interpreter',None )
+        if interpreter is None :
+            interpreter =local .interpreter =Interpreter ()
+        out ,err =io .StringIO (),io .StringIO ()
+        for routed ,stream in zip (streams ,(out ,err ,io .StringIO (inputs .get (path ,'')))):
+            routed .local .stream =stream 
+        start =time .monotonic ()
+        timed_out =False 
+        try :
+            interpreter .run_file (path ,timeout =timeout )
+        except TimeoutError :
+            timed_out =True 
+        except OSError as e :
+            print (f"Dosya okunamadı: {e}",file =sys .stderr )
+        finally :
+            for routed in streams :
+                routed .local .stream =None 
+            interpreter .reset ()
+        return BatchResult (path ,out .getvalue (),err .getvalue (),time .monotonic ()-start ,timed_out )
+
+    sys .stdout ,sys .stderr ,sys .stdin =streams 
+    try :
+        with ThreadPoolExecutor (workers )as pool :
+            return list (pool .map (run ,paths ))
+    finally :
+        sys .stdout ,sys .stderr ,sys .stdin =(routed .original for routed in streams )
+        # a script that set colorama up wrapped the routed streams; wrap the real ones instead
+        module =sys .modules .get ('colorama')
+        if module is not None and module .initialise .orig_stdout is streams [0 ]:
+            wrap_colorama (module )
+
+def batch_main (argv ):
+    """'calistir [--paralel=N] [--zaman=S] dosya.kvn ...': run the programs at
+    once and print each one's output under its name. A dosya.girdi next to
+    dosya.kvn is what its cevap() calls read."""
+    paths =[a for a in argv if not a .startswith ('--')]
+    options =parse_options ({a for a in argv if a .startswith ('--')},switches =(),numbers =('--paralel','--zaman'),texts =())
+    if not paths or options is None or options .get ('--paralel')==0 :
+        print ("Kullanım: python interpreter.py calistir [--paralel=N] [--zaman=S] <dosya.kvn> ...")
+        print ("  --paralel=N    aynı anda çalışan program sayısı (varsayılan 4)")
+        print ("  --zaman=S      bir programın en fazla çalışma süresi, saniye")
+        print ("  dosya.girdi    varsa dosya.kvn'deki cevap() çağrıları buradan okur")
+        sys .exit (1 )
+    inputs ={}
+    for path in paths :
+        try :
+            with open (os .path .splitext (path )[0 ]+'.girdi',encoding ='utf-8')as f :
+                inputs [path ]=f .read ()
+        except OSError :
+            pass 
+    results =run_batch (paths ,options .get ('--paralel',4 ),options .get ('--zaman'),inputs )
+    for r in results :
+        print (f"=== {r.path} ({r.seconds:.2f} sn) ===")
+        print (r .stdout ,end ='')
+        if r .stderr :
+            print (r .stderr ,end ='',file =sys .stderr )
+        if r .timed_out :
+            print (f"--- zaman aşımı: {options['--zaman']} saniyede bitmedi ---")
+    timed_out =sum (r .timed_out for r in results )
+    print (f"{len(results)} program çalıştırıldı"+(f", {timed_out} zaman aşımı"if timed_out else ""))
+
+def main ():
+    if sys .argv [1 :2 ]in (['calistir'],['çalıştır']):
+        batch_main (sys .argv [2 :])
+        return 
+    args =[a for a in sys .argv [1 :]if not a .startswith ('--')]
+    flags ={a for a in sys .argv [1 :]if a .startswith ('--')}
+    options =parse_options (flags )
+    if len (args )!=1 or options is None :
+        print (" __    __                                        ")
+        print ("|  \\  /  \\                                       ")
+        print ("| $$ /  $$ ______  __     __  __    __  _______  ")
+        print ("| $$/  $$ |      \\|  \\   /  \\|  \\  |  \\|       \\ ")
+        print ("| $$  $$   \\$$$$$$\\\\$$\\ /  $$| $$  | $$| $$$$$$$\\")
+        print ("| $$$$$\\  /      $$ \\$$\\  $$ | $$  | $$| $$  | $$")
+        print ("| $$ \\$$\\|  $$$$$$$  \\$$ $$  | $$__/ $$| $$  | $$")
+        print ("| $$  \\$$\\\\$$    $$   \\$$$    \\$$    $$| $$  | $$")
+        print (" \\$$   \\$$ \\$$$$$$$    \\$      \\$$$$$$  \\$$   \\$$")
+        print ("")
+        print ("----- The Kavun Language Interpreter V0.65-------")
+        print ("")
+        print ("Kullanım: python interpreter.py [--derle] [--derinlik=N] [--tampon=N] [--profil[=rapor.json]] [--önbelleksiz] [--arkaplanda-yaz] <dosya.kvn>")
+        print ("  --derle        programı Python'a çevirip öyle çalıştırır")
+        print ("  --derinlik=N   aynı anda çalışabilecek en fazla fonksiyon çağrısı (varsayılan 10000)")
+        print ("  --tampon=N     çıktı bu kadar karakter birikince yazılır (varsayılan 65536, 0: hemen)")
+        print ("  --profil       satır ve fonksiyon başına süreleri ölçer, tabloyu sonunda yazar")
+        print ("                 (--profil=rapor.json ise ayrıca JSON olarak kaydeder)")
+        print ("  --önbelleksiz  dosya.kvnc önbelleğini okumaz ve yazmaz")
+        print ("  --arkaplanda-yaz  dosya_yaz ve dosya_ekle diske arka planda yazılır, program beklemez")
+        print ("")
+        print ("Birden fazla programı aynı anda çalıştırmak için: python interpreter.py calistir [--paralel=N] [--zaman=S] <dosya.kvn> ...")
+        print ("")
+        sys .exit (1 )
+    global MAX_CALL_DEPTH ,file_handles 
+    MAX_CALL_DEPTH =options .get ('--derinlik',MAX_CALL_DEPTH )
+    path =args [0 ]
+    try :
+        source =open (path ,encoding ='utf-8').read ()
+    except FileNotFoundError :
+        print (f"Dosya bulunamadı: {path}")
+        sys .exit (1 )
+
+    lines =source .splitlines ()
+    non_blank =[ln for ln in lines if ln .strip ()and not ln .strip ().startswith ("//")]
+    if len (non_blank )==0 :
+        print ("Çalıştırılan dosya boş. Bir 'Merhaba Dünya' örneği ile başlayabilirsiniz:")
+        print ('\"Merhaba Dünya\" yaz')
+        sys .exit (0 )
+
+    profiler =None 
+    if '--profil'in options :
+        profiler =Profiler (lines )
+        profiler .install ()
+        if '--derle'in options :
+            print ("Not: --profil yorumlayıcı ile çalışır, --derle kullanılmıyor.",file =sys .stderr )
+            del options ['--derle']
+            # profiled runs parse with the timed built-ins, which a cached tree wouldn't have
+    cache =None 
+    if not profiler and '--önbelleksiz'not in options :
+        cache =ProgramCache (path ,source )
+        program =cache .load (lines )
+    else :
+        program =parse_program (lines )
+    if '--arkaplanda-yaz'in options :
+        file_handles =WriteBehind (file_handles )
+    sys .stdout =output =Output (sys .stdout ,options .get ('--tampon',OUTPUT_BUFFER_SIZE ))
+    try :
+        written =run_program (program ,'--derle'in options ,profiler and profiler .start )
+    finally :
+        output .flush ()
+        sys .stdout =output .stream 
+        if process_pool is not None :
+        # before interpreter shutdown, whose exit hook trips over a pool with cancelled work
+            process_pool .shutdown (cancel_futures =True )
+        if cache :
+            cache .save ()
+        if os .environ .get ('KAVUN_DEBUG')=='1':
+            report_cache_stats (sys .stderr )
+        if profiler :
+            profiler .stop ()
+            profiler .report (sys .stderr )
+            if options ['--profil']is not True :
+                profiler .write_json (options ['--profil'])
+    if not written :
+        sys .exit (1 )
+
+if __name__ =="__main__":
+    main ()